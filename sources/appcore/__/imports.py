@@ -27,12 +27,14 @@ import                      abc
 import                      asyncio
 import collections.abc as   cabc
 import contextlib as        ctxl
+import                      copy
 import dataclasses as       dcls
 import                      enum
 import                      inspect
 import                      io
 import itertools as         itert
 import                      os
+import                      re
 import                      shutil
 import                      site
 import                      sys
@@ -46,7 +48,6 @@ import accretive as         accret
 import                      aiofiles
 import                      ictr
 import platformdirs as      pdirs
-import                      tomli
 import typing_extensions as typx
 # --- BEGIN: Injected by Copier ---
 import dynadoc as           ddoc
@@ -56,3 +57,8 @@ import frigid as            immut
 # --- BEGIN: Injected by Copier ---
 from absence import Absential, absent, is_absent
 # --- END: Injected by Copier ---
+
+if sys.version_info >= ( 3, 11 ): # pragma: no cover
+    import tomllib
+else: # pragma: no cover
+    import tomli as tomllib
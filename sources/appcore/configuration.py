@@ -29,6 +29,14 @@ from . import exceptions as _exceptions
 from . import io as _io
 
 
+# Parsed data files are cached by location and validated by file identity,
+# so that reloads of unchanged configuration skip parsing. Callers receive
+# copies, since edits mutate configuration in place.
+_toml_data_cache: dict[
+    str, tuple[ tuple[ int, ... ], dict[ str, __.typx.Any ] ] ] = { }
+_toml_data_cache_maximum = 64
+
+
 class EnablementTristate( __.enum.Enum ): # TODO: Python 3.11: StrEnum
     ''' Disable, enable, or retain the natural state? '''
 
@@ -82,10 +90,8 @@ class TomlAcquirer( AcquirerAbc ):
             if __.is_absent( file ): return __.accret.Dictionary( { } )
         if isinstance( file, __.io.TextIOBase ):
             content = file.read( )
-            configuration = __.tomli.loads( content )
-        else:
-            configuration = await _io.acquire_text_file_async(
-                file, deserializer = __.tomli.loads )
+            configuration = __.tomllib.loads( content )
+        else: configuration = await _acquire_toml_datum( file )
         includes = await self._acquire_includes(
             application_name,
             directories,
@@ -100,19 +106,16 @@ class TomlAcquirer( AcquirerAbc ):
         directories: __.pdirs.PlatformDirs,
         specs: tuple[ str, ... ],
     ) -> __.cabc.Sequence[ dict[ str, __.typx.Any ] ]:
-        locations = tuple(
-            __.Path( spec.format(
-                user_configuration = directories.user_config_path,
-                user_home = __.Path.home( ),
-                application_name = application_name ) )
-            for spec in specs )
+        if not specs: return ( )
+        variables = dict(
+            user_configuration = directories.user_config_path,
+            user_home = __.Path.home( ),
+            application_name = application_name )
         iterables = tuple(
-            (   location.glob( '*.toml' )
-                if location.is_dir( ) else ( location, ) )
-            for location in locations )
-        return await _io.acquire_text_files_async(
-            *( file for file in __.itert.chain.from_iterable( iterables ) ),
-            deserializer = __.tomli.loads )
+            _survey_toml_files( __.Path( spec.format_map( variables ) ) )
+            for spec in specs )
+        return await _acquire_toml_data(
+            *__.itert.chain.from_iterable( iterables ) )
 
     def _discover_copy_template(
         self,
@@ -127,3 +130,94 @@ class TomlAcquirer( AcquirerAbc ):
                 __.shutil.copyfile( template_location, file )
             else: return __.absent
         return file
+
+
+async def _acquire_toml_data(
+    *files: __.Path
+) -> __.cabc.Sequence[ dict[ str, __.typx.Any ] ]:
+    ''' Acquires parsed data files. Caches by file identity. '''
+    identities = tuple( _identify_file( file ) for file in files )
+    entries = tuple(
+        _access_toml_data_cache( file, identity )
+        for file, identity in zip( files, identities ) )
+    misses = tuple(
+        file for file, entry in zip( files, entries ) if entry is None )
+    datas = iter(
+        await _io.acquire_text_files_async(
+            *misses, deserializer = __.tomllib.loads )
+        if misses else ( ) )
+    results: list[ dict[ str, __.typx.Any ] ] = [ ]
+    for file, identity, entry in zip( files, identities, entries ):
+        if entry is None:
+            entry = next( datas )
+            _cache_toml_data( file, identity, entry )
+        results.append( __.copy.deepcopy( entry ) )
+    return tuple( results )
+
+
+async def _acquire_toml_datum( file: __.Path ) -> dict[ str, __.typx.Any ]:
+    ''' Acquires parsed data file. Caches by file identity.
+
+        Reads single file directly, so that read and parse errors propagate
+        without wrapping in exception group.
+    '''
+    identity = _identify_file( file )
+    data = _access_toml_data_cache( file, identity )
+    if data is None:
+        data = await _io.acquire_text_file_async(
+            file, deserializer = __.tomllib.loads )
+        _cache_toml_data( file, identity, data )
+    return __.copy.deepcopy( data )
+
+
+def _access_toml_data_cache(
+    file: __.Path, identity: tuple[ int, ... ] | None
+) -> dict[ str, __.typx.Any ] | None:
+    ''' Provides cached parse of file, if identity is unchanged. '''
+    if identity is None: return None
+    entry = _toml_data_cache.get( str( file ) )
+    if entry is None or entry[ 0 ] != identity: return None
+    return entry[ 1 ]
+
+
+def _cache_toml_data(
+    file: __.Path,
+    identity: tuple[ int, ... ] | None,
+    data: dict[ str, __.typx.Any ],
+) -> None:
+    ''' Caches parse of file under identity from before read.
+
+        Changes during read then appear as mismatch on next acquisition.
+    '''
+    if identity is None: return
+    cache = _toml_data_cache
+    key = str( file )
+    cache.pop( key, None )
+    if len( cache ) >= _toml_data_cache_maximum:
+        del cache[ next( iter( cache ) ) ]
+    cache[ key ] = ( identity, data )
+
+
+def _identify_file( file: __.Path ) -> tuple[ int, ... ] | None:
+    ''' Identifies file by inode, modification time, and size. '''
+    try: status = __.os.stat( file )
+    except OSError: return None
+    return (
+        status.st_dev, status.st_ino, status.st_mtime_ns, status.st_size )
+
+
+def _survey_toml_files( location: __.Path ) -> tuple[ __.Path, ... ]:
+    ''' Surveys TOML files in directory or else returns location as file.
+
+        Directory entries cache file types from the directory listing, which
+        avoids additional status calls for each entry. Unreadable
+        directories are skipped, as with globbing.
+    '''
+    try: scanner = __.os.scandir( location )
+    except ( FileNotFoundError, NotADirectoryError ): return ( location, )
+    except PermissionError: return ( )
+    with scanner:
+        return tuple(
+            location / entry.name for entry in scanner
+            if  __.os.path.normcase( entry.name ).endswith( '.toml' )
+            and entry.is_file( ) )
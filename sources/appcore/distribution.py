@@ -23,7 +23,45 @@
 
 from . import __
 from . import exceptions as _exceptions
-from . import io as _io
+
+
+# Bound for call stack walk during invoker discovery.
+# Async runtimes and application frameworks rarely nest beyond a few dozen
+# frames between an application and this package. Matches common debugger
+# conventions for stack depth limits.
+_invoker_frames_maximum = 64
+
+_package_location = __.Path( __file__ ).parent.resolve( )
+_package_location_prefix = f"{_package_location}{__.os.sep}"
+
+# Read size for project manifests. Larger manifests take multiple reads.
+_pyproject_read_size = 131072
+
+# Parsed ceiling directories by raw environment value. One entry retained.
+_ceiling_directories_cache: dict[ str, frozenset[ str ] ] = { }
+
+# Development information by anchor and ceiling directories.
+# Entries are validated only against modification time of the project
+# manifest which was found. A manifest created later in a directory between
+# anchor and cached project root is not detected for the process lifetime.
+_development_information_cache: dict[
+    tuple[ str, str ], tuple[ __.Path, str, int ] ] = { }
+_development_information_cache_maximum = 64
+
+# Project name as first entry of project table, preceded only by blank
+# lines or comments. Basic string without escapes. Other layouts require
+# full parse of project manifest.
+_project_name_regex = __.re.compile(
+    rb'''^\[project\][ \t]*(?:\#[^\r\n]*)?\r?\n
+         (?:[ \t]*(?:\#[^\r\n]*)?\r?\n)*
+         [ \t]*name[ \t]*=[ \t]*"([^"\\\r\n]*)"[ \t]*(?:\#[^\r\n]*)?\r?$''',
+    __.re.MULTILINE | __.re.VERBOSE )
+
+# Surveying installed distributions reads metadata of every distribution on
+# the import path. Cached per import path; at most one entry retained.
+# Each package maps directly to its first distribution name.
+_packages_distributions_cache: dict[
+    tuple[ str, ... ], __.cabc.Mapping[ str, str ] ] = { }
 
 
 class Information( __.immut.DataclassObject ):
@@ -48,22 +86,24 @@ class Information( __.immut.DataclassObject ):
             location, name = await _acquire_pyinstaller_information( )
             return selfclass(
                 editable = False, location = location, name = name )
+        # Frames are walked at most once; never when caller supplies both.
+        invoker_anchor: __.Absential[ __.Path ] = __.absent
         if __.is_absent( package ):
-            package, _ = _discover_invoker_location( )
+            package, invoker_anchor = _discover_invoker_location( )
         if not __.is_absent( package ): # pragma: no branch
-            # TODO: Python 3.12: importlib.metadata
-            from importlib_metadata import packages_distributions
-            name = packages_distributions( ).get( package )
+            name = _acquire_packages_distributions( ).get( package )
             if name:
                 location = (
                     await _acquire_production_location( package, exits ) )
                 return selfclass(
-                    editable = False, location = location, name = name[ 0 ] )
+                    editable = False, location = location, name = name )
         # https://github.com/pypa/packaging-problems/issues/609
         # Development sources rather than distribution.
         # Implies no use of importlib.resources.
         if __.is_absent( anchor ):
-            _, anchor = _discover_invoker_location( )
+            anchor = (
+                _discover_invoker_location( )[ 1 ]
+                if __.is_absent( invoker_anchor ) else invoker_anchor )
         location, name = (
             await _acquire_development_information( anchor = anchor ) )
         return selfclass(
@@ -79,13 +119,42 @@ class Information( __.immut.DataclassObject ):
 async def _acquire_development_information(
     anchor: __.Path
 ) -> tuple[ __.Path, str ]:
-    location = _locate_pyproject( anchor )
-    pyproject = await _io.acquire_text_file_async(
-        location / 'pyproject.toml', deserializer = __.tomli.loads )
-    name = pyproject[ 'project' ][ 'name' ]
+    cache = _development_information_cache
+    key = (
+        __.os.path.abspath( anchor ),
+        __.os.environ.get( 'GIT_CEILING_DIRECTORIES', '' ) )
+    if key in cache:
+        location, name, mtime = cache[ key ]
+        if _detect_pyproject_mtime( location ) == mtime:
+            return location, name
+        del cache[ key ]
+    # Traversal, read, and parse share one worker thread, so that slow
+    # filesystems do not stall the event loop. Sequential probes are
+    # cheaper than fanning out stats on local filesystems.
+    location, name, mtime = await __.asyncio.to_thread(
+        _discover_development_information, anchor )
+    if mtime is not None:
+        if len( cache ) >= _development_information_cache_maximum:
+            del cache[ next( iter( cache ) ) ]
+        cache[ key ] = ( location, name, mtime )
     return location, name
 
 
+def _acquire_packages_distributions( ) -> __.cabc.Mapping[ str, str ]:
+    ''' Maps top-level packages to distributions. Caches per import path. '''
+    key = tuple( __.sys.path )
+    cache = _packages_distributions_cache
+    if key not in cache:
+        # TODO: Python 3.12: importlib.metadata
+        from importlib_metadata import packages_distributions
+        cache.clear( )
+        cache[ key ] = {
+            package: distributions[ 0 ]
+            for package, distributions in packages_distributions( ).items( )
+            if distributions }
+    return cache[ key ]
+
+
 async def _acquire_production_location(
     package: str, exits: __.ctxl.AsyncExitStack
 ) -> __.Path:
@@ -105,6 +174,13 @@ async def _acquire_pyinstaller_information( # pragma: no cover
     return await _acquire_development_information( anchor = anchor_ )
 
 
+def _detect_pyproject_mtime( location: __.Path ) -> int | None:
+    ''' Detects modification time of project manifest, if it exists. '''
+    try: status = __.os.stat( location / 'pyproject.toml' )
+    except OSError: return None
+    return status.st_mtime_ns
+
+
 def _detect_package_boundary( mname: str ) -> __.Absential[ str ]:
     ''' Finds package boundary, including for namespace packages. '''
     if not mname or mname == '__main__': return __.absent
@@ -120,70 +196,133 @@ def _detect_package_boundary( mname: str ) -> __.Absential[ str ]:
     return components[ 0 ]
 
 
+def _discover_development_information(
+    anchor: __.Path
+) -> tuple[ __.Path, str, int | None ]:
+    ''' Locates, reads, and parses project manifest. '''
+    location = _locate_pyproject( anchor )
+    mtime = _detect_pyproject_mtime( location )
+    name = _extract_project_name( _read_pyproject( location ) )
+    return location, name, mtime
+
+
 def _discover_invoker_location( ) -> tuple[ __.Absential[ str ], __.Path ]:
     ''' Discovers file path of caller for project root detection. '''
-    package_location = __.Path( __file__ ).parent.resolve( )
-    stdlib_locations, sp_locations = _provide_standard_locations( )
+    stdlib_prefixes, sp_prefixes = _provide_standard_locations( )
     frame = __.inspect.currentframe( )
     if frame is None: return __.absent, __.Path.cwd( )
     # Walk up the call stack to find frame outside of this package.
-    while True:
+    # Locations are classified as strings; path objects only for result.
+    for _ in range( _invoker_frames_maximum ):
         frame = frame.f_back
         if frame is None: break # pragma: no cover
-        location = __.Path( frame.f_code.co_filename).resolve( )
-        # Skip frames within this package
-        if location.is_relative_to( package_location ): # pragma: no cover
+        filename = frame.f_code.co_filename
+        # Skip frames within this package.
+        # Cheap prefix check precedes resolution of location.
+        if filename.startswith( _package_location_prefix ): continue
+        location = __.os.path.realpath( filename )
+        if location.startswith( _package_location_prefix ): # pragma: no cover
             continue
-        in_site_packages = any(
-            location.is_relative_to( sp_location )
-            for sp_location in sp_locations )
-        in_stdlib_locations = any(
-            location.is_relative_to( stdlib_location )
-            for stdlib_location in stdlib_locations )
         # Skip standard library paths, unless in site-packages.
-        if not in_site_packages and in_stdlib_locations: continue
+        if (    location.startswith( stdlib_prefixes )
+            and not location.startswith( sp_prefixes )
+        ): continue
         mname = frame.f_globals.get( '__name__' )
         if not mname or mname == '__main__': continue
         pname = _detect_package_boundary( mname )
         if not __.is_absent( pname ):
-            return pname, location.parent
+            return pname, __.Path( location ).parent
         continue # pragma: no cover
     # Fallback location is current working directory.
-    return __.absent, __.Path.cwd( ) # pragma: no cover
+    return __.absent, __.Path.cwd( )
+
+
+def _extract_project_name( data: bytes ) -> str:
+    ''' Extracts project name from project manifest. '''
+    # Fast path for conventional layout, where name leads project table.
+    match = _project_name_regex.search( data )
+    if match: return match[ 1 ].decode( 'utf-8' )
+    pyproject = __.tomllib.loads( data.decode( 'utf-8' ) )
+    return pyproject[ 'project' ][ 'name' ]
+
+
+def _identify_location(
+    location: str | __.Path
+) -> tuple[ int, int ] | None:
+    ''' Identifies location by device and inode, if it exists. '''
+    try: status = __.os.stat( location )
+    except OSError: return None
+    return status.st_dev, status.st_ino
 
 
 def _locate_pyproject( project_anchor: __.Path ) -> __.Path:
     ''' Finds project manifest, if it exists. Errors otherwise. '''
-    initial = project_anchor.resolve( )
-    current = initial if initial.is_dir( ) else initial.parent
-    limits: set[ __.Path ] = set( )
-    for limits_variable in ( 'GIT_CEILING_DIRECTORIES', ):
-        limits_value = __.os.environ.get( limits_variable )
-        if not limits_value: continue  # pragma: no cover
-        limits.update(  # pragma: no cover
-            __.Path( limit ).resolve( )
-            for limit in limits_value.split( ':' ) if limit.strip( ) )
-    while current != current.parent:  # Not at filesystem root
-        if ( current / 'pyproject.toml' ).exists( ):
-            return current
-        if current in limits:
+    # Walk with strings rather than path objects; one stat per level.
+    initial = __.os.path.realpath( project_anchor )
+    current = (
+        initial if __.os.path.isdir( initial )
+        else __.os.path.dirname( initial ) )
+    limits_value = __.os.environ.get( 'GIT_CEILING_DIRECTORIES', '' )
+    # Compare by file identity rather than by resolved path.
+    limits = frozenset(
+        identity for identity in map(
+            _identify_location, _parse_ceiling_directories( limits_value ) )
+        if identity is not None )
+    # Not at filesystem root
+    while ( parent := __.os.path.dirname( current ) ) != current:
+        if __.os.path.exists( __.os.path.join( current, 'pyproject.toml' ) ):
+            return __.Path( current )
+        if limits and _identify_location( current ) in limits:
             raise _exceptions.FileLocateFailure(  # noqa: TRY003 # pragma: no cover
                 'project root discovery', 'pyproject.toml' )
-        current = current.parent
+        current = parent
     raise _exceptions.FileLocateFailure(  # noqa: TRY003 # pragma: no cover
         'project root discovery', 'pyproject.toml' )
 
 
+def _read_pyproject( location: __.Path ) -> bytes:
+    ''' Reads project manifest as raw bytes. '''
+    # Project manifests are small; usually consumed by a single read.
+    # Avoids buffered text stream machinery.
+    flags = __.os.O_RDONLY | getattr( __.os, 'O_BINARY', 0 )
+    descriptor = __.os.open( location / 'pyproject.toml', flags )
+    try:
+        data = __.os.read( descriptor, _pyproject_read_size )
+        if len( data ) == _pyproject_read_size:
+            chunks = [ data ]
+            while chunk := __.os.read( descriptor, _pyproject_read_size ):
+                chunks.append( chunk )
+            data = b''.join( chunks )
+    finally: __.os.close( descriptor )
+    return data
+
+
+def _parse_ceiling_directories( value: str ) -> frozenset[ str ]:
+    ''' Parses ceiling directories list. Caches by raw value. '''
+    cache = _ceiling_directories_cache
+    if value not in cache:
+        cache.clear( )
+        cache[ value ] = frozenset(
+            limit for limit in value.split( __.os.pathsep )
+            if limit.strip( ) )
+    return cache[ value ]
+
+
 def _provide_standard_locations( ) -> tuple[
-    frozenset[ __.Path ], frozenset[ __.Path ]
+    tuple[ str, ... ], tuple[ str, ... ]
 ]:
-    stdlib_locations = frozenset( (
-        __.Path( __.syscfg.get_path( 'stdlib' ) ).resolve( ),
-        __.Path( __.syscfg.get_path( 'platstdlib' ) ).resolve( ) ) )
-    sp_locations: set[ __.Path ] = set( )
-    for path in __.site.getsitepackages( ):
-        sp_locations.add( __.Path( path ).resolve( ) )
+    ''' Provides location prefixes for standard library and site-packages. '''
+    realpath = __.os.path.realpath
+    stdlib_locations = {
+        realpath( __.syscfg.get_path( 'stdlib' ) ),
+        realpath( __.syscfg.get_path( 'platstdlib' ) ) }
+    sp_locations = {
+        realpath( path ) for path in __.site.getsitepackages( ) }
     with __.ctxl.suppress( AttributeError ):
-        sp_locations.add(
-            __.Path( __.site.getusersitepackages( ) ).resolve( ) )
-    return frozenset( stdlib_locations ), frozenset( sp_locations )
+        sp_locations.add( realpath( __.site.getusersitepackages( ) ) )
+    # Trailing separators make prefix checks respect path boundaries.
+    return (
+        tuple( __.os.path.join( location, '' )
+               for location in stdlib_locations ),
+        tuple( __.os.path.join( location, '' )
+               for location in sp_locations ) )
@@ -25,6 +25,11 @@ from . import __
 from . import asyncf as _asyncf
 
 
+# Reads in flight are bounded so that large file sets cannot exhaust file
+# descriptors. Matches default thread pool size; further reads would queue.
+_files_reads_maximum = min( 32, ( __.os.cpu_count( ) or 1 ) + 4 )
+
+
 async def acquire_text_file_async(
     file: str | __.Path,
     charset: str = 'utf-8',
@@ -48,10 +53,14 @@ async def acquire_text_files_async(
     return_exceptions: bool = False
 ) -> __.typx.Sequence[ __.typx.Any ]:
     ''' Reads files in parallel asynchronously. '''
-    # TODO? Batch to prevent fd exhaustion over large file sets.
-    return await _asyncf.gather_async(
-        *(  acquire_text_file_async(
+    limiter = __.asyncio.Semaphore( _files_reads_maximum )
+
+    async def acquire( file: str | __.Path ) -> __.typx.Any:
+        async with limiter:
+            return await acquire_text_file_async(
                 file, charset = charset, deserializer = deserializer )
-            for file in files ),
+
+    return await _asyncf.gather_async(
+        *( acquire( file ) for file in files ),
         error_message = 'Failure to read files.',
         return_exceptions = return_exceptions )
@@ -21,8 +21,11 @@
 ''' Standard test fixtures for temp directories and dependency injection. '''
 
 
+import asyncio
 import tempfile
+from contextlib import asynccontextmanager
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 from .__ import PACKAGE_NAME, cache_import_module
@@ -97,37 +100,56 @@ version = "1.0.0"
     return template_file
 
 
-def create_fake_project_with_pyproject(
-    project_name = 'test-project',
-    project_version = '1.0.0'
-):
-    ''' Creates a temporary directory with a pyproject.toml file.
-    '''
-    temp_dir = Path( tempfile.mkdtemp( ) )
-    pyproject_path = temp_dir / 'pyproject.toml'
-    pyproject_content = f'''
-[project]
-name = "{project_name}"
-version = "{project_version}"
-
-[build-system]
-requires = ["setuptools"]
-build-backend = "setuptools.build_meta"
-    '''
-    pyproject_path.write_text( pyproject_content )
-    return temp_dir, pyproject_path
+class ExitsRecorder:
+    ''' Lightweight stand-in for exit stack. Records entered contexts. '''
 
+    def __init__( self, result ):
+        self.contexts = [ ]
+        self.result = result
 
-def create_nested_project_structure(
-    project_name = 'nested-project',
-    nesting_levels = 3
-):
-    ''' Creates a nested directory structure with pyproject.toml at the root.
-    '''
-    project_root, _ = create_fake_project_with_pyproject(
-        project_name = project_name )
-    current_dir = project_root
-    for i in range( nesting_levels ):
-        current_dir = current_dir / f'level_{i}'
-        current_dir.mkdir( parents = True, exist_ok = True )
-    return project_root, current_dir
+    def enter_context( self, context ):
+        self.contexts.append( context )
+        return self.result
+
+
+class ReadsRecorder:
+    ''' Lightweight stand-in for aiofiles open. Counts reads in flight. '''
+
+    def __init__( self, render = str ):
+        self.active = 0
+        self.peak = 0
+        self.render = render
+
+    @asynccontextmanager
+    async def __call__( self, file, encoding ):
+        self.active += 1
+        self.peak = max( self.peak, self.active )
+        try: yield _RecordedStream( self.render( file ) )
+        finally: self.active -= 1
+
+
+class _RecordedStream:
+
+    def __init__( self, content ): self.content = content
+
+    async def read( self ):
+        await asyncio.sleep( 0 )
+        return self.content
+
+
+def create_frame( filename, mname = None, back = None ):
+    ''' Creates lightweight stand-in for call stack frame. '''
+    return SimpleNamespace(
+        f_code = SimpleNamespace( co_filename = str( filename ) ),
+        f_globals = { '__name__': mname },
+        f_back = back )
+
+
+def create_fake_pyproject( fs, project_root, project_name ):
+    ''' Creates pyproject.toml for project on fake filesystem. '''
+    pyproject_path = Path( project_root ) / 'pyproject.toml'
+    fs.create_file(
+        pyproject_path,
+        contents = (
+            f'[project]\nname = "{project_name}"\nversion = "1.0.0"\n' ) )
+    return pyproject_path
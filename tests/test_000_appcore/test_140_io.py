@@ -21,13 +21,12 @@
 ''' I/O utilities tests. '''
 
 
-import tempfile
-
 from pathlib import Path
 
 import pytest
 
 from .__ import PACKAGE_NAME, cache_import_module
+from .fixtures import ReadsRecorder
 
 MODULE_QNAME = f"{PACKAGE_NAME}.io"
 module = cache_import_module( MODULE_QNAME )
@@ -36,81 +35,83 @@ module = cache_import_module( MODULE_QNAME )
 @pytest.mark.asyncio
 async def test_100_acquire_text_file_async_without_deserializer( ):
     ''' Text file acquisition returns raw text, no deserializer. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
     content = 'test content\nline 2'
-    with tempfile.NamedTemporaryFile(
-        mode = 'w', delete = False ) as temp_file:
-        temp_file.write( content )
-        temp_file_path = Path( temp_file.name )
-    try:
-        result = await module.acquire_text_file_async( temp_file_path )
+    with Patcher( ) as patcher:
+        file = Path( '/fake/content.txt' )
+        patcher.fs.create_file( file, contents = content )
+        result = await module.acquire_text_file_async( file )
         assert result == content
         assert isinstance( result, str )
-    finally:
-        temp_file_path.unlink( )
 
 
 @pytest.mark.asyncio
 async def test_110_acquire_text_file_async_with_deserializer( ):
     ''' Text file acquisition applies deserializer when provided. '''
     import json
+
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
     data = { 'name': 'test', 'value': 42 }
-    content = json.dumps( data )
-    with tempfile.NamedTemporaryFile(
-        mode = 'w', delete = False ) as temp_file:
-        temp_file.write( content )
-        temp_file_path = Path( temp_file.name )
-    try:
+    with Patcher( ) as patcher:
+        file = Path( '/fake/content.json' )
+        patcher.fs.create_file( file, contents = json.dumps( data ) )
         result = await module.acquire_text_file_async(
-            temp_file_path,
+            file,
             deserializer = json.loads
         )
         assert result == data
         assert isinstance( result, dict )
-    finally:
-        temp_file_path.unlink( )
 
 
 @pytest.mark.asyncio
 async def test_120_acquire_text_file_async_with_charset( ):
     ''' Text file acquisition respects charset parameter. '''
-    content = 'test content'
-    with tempfile.NamedTemporaryFile(
-        mode = 'w', delete = False ) as temp_file:
-        temp_file.write( content )
-        temp_file_path = Path( temp_file.name )
-    try:
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    content = 'test content: café'
+    with Patcher( ) as patcher:
+        file = Path( '/fake/content.txt' )
+        patcher.fs.create_file(
+            file, contents = content, encoding = 'latin-1' )
         result = await module.acquire_text_file_async(
-            temp_file_path,
-            charset = 'utf-8'
+            file,
+            charset = 'latin-1'
         )
         assert result == content
-    finally:
-        temp_file_path.unlink( )
 
 
 @pytest.mark.asyncio
 async def test_130_acquire_text_files_async( ):
     ''' Text files acquisition handles multiple files. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
     content1 = 'file 1 content'
     content2 = 'file 2 content'
-    from contextlib import ExitStack
-    with ExitStack() as stack:
-        temp1 = stack.enter_context(
-            tempfile.NamedTemporaryFile( mode = 'w', delete = False ) )
-        temp2 = stack.enter_context(
-            tempfile.NamedTemporaryFile( mode = 'w', delete = False ) )
-        temp1.write( content1 )
-        temp2.write( content2 )
-        temp1_path = Path( temp1.name )
-        temp2_path = Path( temp2.name )
-    try:
+    with Patcher( ) as patcher:
+        file1 = Path( '/fake/file1.txt' )
+        file2 = Path( '/fake/file2.txt' )
+        patcher.fs.create_file( file1, contents = content1 )
+        patcher.fs.create_file( file2, contents = content2 )
         results = await module.acquire_text_files_async(
-            temp1_path,
-            temp2_path
+            file1,
+            file2
         )
         assert len( results ) == 2
         assert results[ 0 ] == content1
         assert results[ 1 ] == content2
-    finally:
-        temp1_path.unlink( )
-        temp2_path.unlink( )
+
+
+@pytest.mark.asyncio
+async def test_140_acquire_text_files_async_bounds_reads( ):
+    ''' Text files acquisition bounds number of reads in flight. '''
+    from unittest.mock import patch
+    recorder = ReadsRecorder( )
+    files = tuple(
+        f"/fake/{index}.toml"
+        for index in range( module._files_reads_maximum * 2 ) )
+    with patch( 'aiofiles.open', recorder ):
+        results = await module.acquire_text_files_async( *files )
+    assert tuple( results ) == files
+    assert recorder.peak == module._files_reads_maximum
@@ -29,156 +29,144 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from .__ import PACKAGE_NAME, cache_import_module
+from .fixtures import ExitsRecorder, create_fake_pyproject, create_frame
 
 MODULE_QNAME = f"{PACKAGE_NAME}.distribution"
 module = cache_import_module( MODULE_QNAME )
+PACKAGE_LOCATION = Path( module.__file__ ).parent.resolve( )
 
 exceptions_module = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
 
+PYPROJECT_ABSENCE_PATTERN = r"'pyproject\.toml' for project root discovery"
+TEST_LOCATION = Path( '/test/path' )
 
-def test_100_information_creation( ):
-    ''' Information creates with required fields. '''
-    location = Path( '/test/path' )
-    info = module.Information(
-        name = 'test-package',
-        location = location,
-        editable = True
-    )
-    assert info.name == 'test-package'
-    assert info.location == location
-    assert info.editable is True
 
+@pytest.fixture( autouse = True )
+def clear_distribution_caches( ):
+    ''' Clears module caches so that patched lookups take effect. '''
+    module._development_information_cache.clear( )
+    module._packages_distributions_cache.clear( )
 
-def test_110_information_provide_data_location_base( ):
-    ''' Information provides base data location. '''
-    location = Path( '/test/path' )
-    info = module.Information(
-        name = 'test-package',
-        location = location,
-        editable = True
-    )
-    data_location = info.provide_data_location( )
-    assert data_location == location / 'data'
 
+@pytest.fixture
+def no_installed_packages( monkeypatch ):
+    ''' Reports no installed distributions for any package. '''
+    import importlib_metadata
+    monkeypatch.setattr(
+        importlib_metadata, 'packages_distributions', lambda: { } )
 
-def test_120_information_provide_data_location_with_appendages( ):
-    ''' Information provides data location with appendages. '''
-    location = Path( '/test/path' )
-    info = module.Information(
+
+@pytest.fixture( scope = 'module' )
+def information( ):
+    ''' Provides immutable information instance shared across tests. '''
+    return module.Information(
         name = 'test-package',
-        location = location,
+        location = TEST_LOCATION,
         editable = True
     )
-    data_location = info.provide_data_location( 'configs', 'app.toml' )
-    assert data_location == location / 'data' / 'configs' / 'app.toml'
 
 
-def test_130_information_provide_data_location_multiple_appendages( ):
-    ''' Information provides data location with multiple appendages. '''
-    location = Path( '/test/path' )
-    info = module.Information(
-        name = 'test-package',
-        location = location,
-        editable = True
-    )
-    data_location = info.provide_data_location( 'a', 'b', 'c', 'd' )
-    assert data_location == location / 'data' / 'a' / 'b' / 'c' / 'd'
+def test_100_information_creation( information ):
+    ''' Information creates with required fields. '''
+    assert information.name == 'test-package'
+    assert information.location == TEST_LOCATION
+    assert information.editable is True
+    fields = module.Information.__dataclass_fields__
+    assert { 'name', 'location', 'editable' } <= fields.keys( )
+
 
+@pytest.mark.parametrize(
+    'appendages',
+    ( ( ), ( 'configs', 'app.toml' ), ( 'a', 'b', 'c', 'd' ) )
+)
+def test_110_information_provide_data_location( information, appendages ):
+    ''' Information provides data location with optional appendages. '''
+    data_location = information.provide_data_location( *appendages )
+    assert data_location == information.location.joinpath(
+        'data', *appendages )
 
-def test_140_information_immutability( ):
+
+def test_140_information_immutability( information ):
     ''' Information instances are immutable. '''
-    location = Path( '/test/path' )
-    info = module.Information(
-        name = 'test-package',
-        location = location,
-        editable = True
-    )
     # Should not be able to modify fields after creation
     with pytest.raises( ( AttributeError, TypeError ) ):
-        info.name = 'modified-package'  # type: ignore
+        information.name = 'modified-package'  # type: ignore
 
 
-def test_150_information_equality( ):
+def test_150_information_equality( information ):
     ''' Information instances with same data are equal. '''
-    location = Path( '/test/path' )
-    info1 = module.Information(
+    other = module.Information(
         name = 'test-package',
-        location = location,
+        location = TEST_LOCATION,
         editable = True
     )
-    info2 = module.Information(
-        name = 'test-package',
-        location = location,
-        editable = True
-    )
-    assert info1 == info2
+    assert information == other
 
 
-def test_160_information_inequality( ):
+def test_160_information_inequality( information ):
     ''' Information instances with different data are not equal. '''
-    location = Path( '/test/path' )
-    info1 = module.Information(
-        name = 'test-package',
-        location = location,
-        editable = True
-    )
-    info2 = module.Information(
+    other = module.Information(
         name = 'other-package',
-        location = location,
+        location = information.location,
         editable = True
     )
-    assert info1 != info2
+    assert information != other
 
 
 @pytest.mark.asyncio
 async def test_200_prepare_production_distribution( ):
     ''' Information.prepare handles production distribution path. '''
-    exits = MagicMock( )
+    temp_path = Path( '/extracted/location' )
+    exits = ExitsRecorder( temp_path )
     # Mock an installed package to trigger production mode (lines 56-58)
     with (
         patch( 'importlib_metadata.packages_distributions' ) as mock_pkg,
-        patch( 'importlib_resources.files' ) as mock_files,
+        patch( 'importlib_resources.files' ),
         patch( 'importlib_resources.as_file' ) as mock_as_file
     ):
         mock_pkg.return_value = { 'test-package': [ 'test-distribution' ] }
-        mock_files.return_value = MagicMock( )
-        temp_path = Path( '/extracted/location' )
-        exits.enter_context.return_value = temp_path
-        mock_as_file.return_value = MagicMock( )
         info = await module.Information.prepare(
             exits, package = 'test-package' )
         # Verify production distribution was detected
         assert info.editable is False  # Production mode
         assert info.name == 'test-distribution'
-        assert info.location.resolve( ) == temp_path.resolve( )
+        assert info.location == temp_path
+        assert exits.contexts == [ mock_as_file.return_value ]
 
 
-@pytest.mark.asyncio
-async def test_210_prepare_development_mode_simple( ):
-    ''' Information.prepare creates development mode instance. '''
-    dev_info = module.Information(
-        name = 'dev-package',
-        location = Path( '/test/path' ),
-        editable = True
+@pytest.mark.parametrize(
+    'name, location, editable',
+    (
+        ( 'dev-package', TEST_LOCATION, True ),
+        ( 'prod-package', Path( '/production/path' ), False ),
     )
-    # Verify development mode characteristics
-    assert dev_info.editable is True
-    assert dev_info.location == Path( '/test/path' )
-    assert dev_info.name == 'dev-package'
-
-
-@pytest.mark.asyncio
-async def test_220_prepare_production_mode_simple( ):
-    ''' Information.prepare creates production mode instance. '''
-    prod_info = module.Information(
-        name = 'prod-package',
-        location = Path( '/production/path' ),
-        editable = False
-    )
-    # Verify production mode characteristics
-    assert prod_info.editable is False
-    assert prod_info.location == Path( '/production/path' )
-    assert prod_info.name == 'prod-package'
+)
+def test_210_information_mode_characteristics( name, location, editable ):
+    ''' Information reflects development and production modes. '''
+    info = module.Information(
+        name = name, location = location, editable = editable )
+    assert info.editable is editable
+    assert info.location == location
+    assert info.name == name
+
+
+def test_230_acquire_packages_distributions_cached( ):
+    ''' Survey of installed distributions is cached per import path. '''
+    with patch(
+        'importlib_metadata.packages_distributions',
+        return_value = {
+            'test-package': [ 'test-distribution', 'other-distribution' ],
+            'orphan-package': [ ] }
+    ) as mock_pkg:
+        first = module._acquire_packages_distributions( )
+        second = module._acquire_packages_distributions( )
+        assert first is second
+        assert first == { 'test-package': 'test-distribution' }
+        assert mock_pkg.call_count == 1
+        paths = [ *module.__.sys.path, '/fake/extra/path' ]
+        with patch.object( module.__.sys, 'path', paths ):
+            module._acquire_packages_distributions( )
+        assert mock_pkg.call_count == 2
 
 
 def test_300_locate_pyproject_function_exists( ):
@@ -197,99 +185,180 @@ def test_310_locate_pyproject_exception_type( ):
     assert 'project root discovery' in str( sample_exception )
 
 
-def test_320_locate_pyproject_environment_awareness( ):
-    ''' _locate_pyproject is aware of environment variables. '''
-    # Verify the function accesses GIT_CEILING_DIRECTORIES
-    # by checking the code reads os.environ
-    import inspect
-    source = inspect.getsource( module._locate_pyproject )
-    assert 'GIT_CEILING_DIRECTORIES' in source
-    assert 'os.environ' in source or '__.os.environ' in source
+def test_320_locate_pyproject_environment_awareness( monkeypatch ):
+    ''' _locate_pyproject consults GIT_CEILING_DIRECTORIES on each call. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        project_root = Path( '/fake/project' )
+        ceiling_dir = project_root / 'ceiling'
+        nested_dir = ceiling_dir / 'nested'
+        fs.create_dir( nested_dir )
+        create_fake_pyproject( fs, project_root, 'environment-test' )
+        monkeypatch.setenv( 'GIT_CEILING_DIRECTORIES', str( ceiling_dir ) )
+        with pytest.raises(
+            exceptions_module.FileLocateFailure,
+            match = PYPROJECT_ABSENCE_PATTERN
+        ): module._locate_pyproject( nested_dir )
+        monkeypatch.delenv( 'GIT_CEILING_DIRECTORIES' )
+        assert module._locate_pyproject( nested_dir ) == project_root
+
+
+def test_325_parse_ceiling_directories( ):
+    ''' Ceiling directories are split on path separator and cached. '''
+    value = os.pathsep.join( ( '/fake/first', '', ' ', '/fake/second' ) )
+    limits = module._parse_ceiling_directories( value )
+    assert limits == frozenset( ( '/fake/first', '/fake/second' ) )
+    assert module._parse_ceiling_directories( value ) is limits
+    assert module._parse_ceiling_directories( '' ) == frozenset( )
 
 
 @pytest.mark.asyncio
 async def test_330_acquire_development_information_with_location( ):
     ''' _acquire_development_information uses provided location. '''
-    # Test with real temporary directory since aiofiles integration is complex
-    import tempfile
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        temp_path = Path( temp_dir )
-        pyproject_path = temp_path / 'pyproject.toml'
-        pyproject_content = '''
-[project]
-name = "test-package"
-version = "1.0.0"
-        '''
-        pyproject_path.write_text( pyproject_content )
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        project_root = Path( '/fake/project' )
+        create_fake_pyproject( patcher.fs, project_root, 'test-package' )
         location, name = await module._acquire_development_information(
-            anchor = temp_path )
-        assert location.resolve( ) == temp_path.resolve( )
+            anchor = project_root )
+        assert location == project_root
         assert name == 'test-package'
 
 
 @pytest.mark.asyncio
 async def test_340_acquire_development_information_auto_locate( ):
     ''' _acquire_development_information auto-locates pyproject.toml. '''
-    # Use real temporary directory for async file operations
-    import tempfile
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        temp_path = Path( temp_dir )
-        pyproject_path = temp_path / 'pyproject.toml'
-        pyproject_content = '''
-[project]
-name = "auto-located-package"
-version = "1.0.0"
-        '''
-        pyproject_path.write_text( pyproject_content )
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        project_root = Path( '/fake/project' )
+        nested_dir = project_root / 'level_0' / 'level_1'
+        fs.create_dir( nested_dir )
+        create_fake_pyproject( fs, project_root, 'auto-located-package' )
         # Test that function can locate and parse pyproject.toml
         location, name = await module._acquire_development_information(
-            anchor = temp_path )
-        assert location.resolve( ) == temp_path.resolve( )
+            anchor = nested_dir )
+        assert location == project_root
         assert name == 'auto-located-package'
 
 
+def test_345_read_pyproject_large_manifest( ):
+    ''' Project manifest larger than single read size is fully read. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        project_root = Path( '/fake/project' )
+        padding = '#' * ( module._pyproject_read_size * 2 )
+        contents = f"{padding}\n[project]\nname = \"large-package\"\n"
+        fs.create_file( project_root / 'pyproject.toml', contents = contents )
+        data = module._read_pyproject( project_root )
+        assert data == contents.encode( 'utf-8' )
+
+
+@pytest.mark.asyncio
+async def test_346_acquire_development_information_cached( ):
+    ''' Development information is cached until project manifest changes. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        project_root = Path( '/fake/project' )
+        pyproject_path = project_root / 'pyproject.toml'
+        fs.create_file(
+            pyproject_path, contents = '[project]\nname = "cached"\n' )
+        os.utime( pyproject_path, ns = ( 1, 1 ) )
+        _, name = await module._acquire_development_information(
+            anchor = project_root )
+        assert name == 'cached'
+        # Same modification time: cached result is reused.
+        pyproject_path.write_text( '[project]\nname = "changed"\n' )
+        os.utime( pyproject_path, ns = ( 1, 1 ) )
+        _, name = await module._acquire_development_information(
+            anchor = project_root )
+        assert name == 'cached'
+        # Changed modification time: cached result is refreshed.
+        os.utime( pyproject_path, ns = ( 2, 2 ) )
+        _, name = await module._acquire_development_information(
+            anchor = project_root )
+        assert name == 'changed'
+
+
+def test_347_extract_project_name_conventional( ):
+    ''' Project name is extracted when leading project table. '''
+    data = (
+        b'[build-system]\nrequires = [ "hatchling" ]\n\n'
+        b'[project]  # metadata\n\n# identity\nname = "lead-name"\n'
+        b'version = "1.0.0"\n' )
+    assert module._project_name_regex.search( data )
+    assert module._extract_project_name( data ) == 'lead-name'
+
+
+def test_348_extract_project_name_fallback( ):
+    ''' Project name is extracted by full parse for other layouts. '''
+    data = (
+        b'[project]\nversion = "1.0.0"\n'
+        b'description = """\nname = "decoy"\n"""\nname = "real-name"\n' )
+    assert not module._project_name_regex.search( data )
+    assert module._extract_project_name( data ) == 'real-name'
+    data = b'[project]\nname = "escaped\\u002dname"\n'
+    assert module._extract_project_name( data ) == 'escaped-name'
+
+
+@pytest.mark.asyncio
+async def test_349_acquire_development_information_evicts_oldest( ):
+    ''' Development information cache evicts oldest entry when full. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    cache = module._development_information_cache
+    dummies = tuple(
+        ( f"/dummy/{index}", '' )
+        for index in range( module._development_information_cache_maximum ) )
+    for dummy in dummies: cache[ dummy ] = ( Path( dummy[ 0 ] ), 'dummy', 0 )
+    with Patcher( ) as patcher:
+        project_root = Path( '/fake/project' )
+        create_fake_pyproject( patcher.fs, project_root, 'evicting-package' )
+        await module._acquire_development_information( anchor = project_root )
+    assert dummies[ 0 ] not in cache
+    assert dummies[ 1 ] in cache
+    assert len( cache ) == module._development_information_cache_maximum
+
+
 @pytest.mark.asyncio
 async def test_350_acquire_production_location( ):
     ''' _acquire_production_location extracts package to temp directory. '''
-    exits = MagicMock( )
     temp_path = Path( '/temp/extracted' )
-    exits.enter_context.return_value = temp_path
+    exits = ExitsRecorder( temp_path )
     with (
         patch( 'importlib_resources.files' ) as mock_files,
         patch( 'importlib_resources.as_file' ) as mock_as_file
     ):
-        mock_files.return_value = MagicMock( )
-        mock_as_file.return_value = MagicMock( )
         result = await module._acquire_production_location(
             'test-package', exits )
         assert result == temp_path
         mock_files.assert_called_once_with( 'test-package' )
-        exits.enter_context.assert_called_once( )
+        assert exits.contexts == [ mock_as_file.return_value ]
 
 
-def test_400_information_string_representation( ):
+def test_400_information_string_representation( information ):
     ''' Information has useful string representation. '''
-    location = Path( '/test/path' )
-    info = module.Information(
-        name = 'test-package',
-        location = location,
-        editable = True
-    )
-    str_repr = str( info )
+    str_repr = str( information )
     assert 'test-package' in str_repr
     # Check path components instead of string representation for Windows
     assert 'test' in str_repr and 'path' in str_repr
     assert 'editable' in str_repr.lower( ) or 'true' in str_repr.lower( )
 
 
-def test_410_information_type_annotations( ):
-    ''' Information has proper type annotations. '''
-    # Check that the class has the expected attributes
-    assert hasattr( module.Information, 'name' )
-    assert hasattr( module.Information, 'location' )
-    assert hasattr( module.Information, 'editable' )
-    # Check that it's a dataclass
-    assert hasattr( module.Information, '__dataclass_fields__' )
+def test_415_information_slotted( ):
+    ''' Information instances carry slots rather than dictionaries. '''
+    info = module.Information(
+        name = 'slotted', location = TEST_LOCATION, editable = False )
+    assert 'location' in module.Information.__slots__
+    assert not hasattr( info, '__dict__' )
 
 
 def test_500_discover_invoker_location_finds_caller( ):
@@ -303,13 +372,10 @@ def test_500_discover_invoker_location_finds_caller( ):
         fs.create_dir( nested_dir )
         caller_file = nested_dir / 'caller.py'
         fs.create_file( caller_file, contents = '# test caller file' )
-        external_frame = MagicMock( )
-        external_frame.f_code.co_filename = str( caller_file )
-        external_frame.f_globals = { '__name__': 'test.caller.module' }
-        external_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = '/fake/appcore/distribution.py'
-        appcore_frame.f_back = external_frame
+        external_frame = create_frame(
+            caller_file, mname = 'test.caller.module' )
+        appcore_frame = create_frame(
+            '/fake/appcore/distribution.py', back = external_frame )
         with (
             patch( 'inspect.currentframe', return_value = appcore_frame ),
             patch.object( module.__.Path, 'cwd',
@@ -329,9 +395,7 @@ def test_510_discover_invoker_location_fallback( ):
         fs.create_dir( cwd )
         appcore_path = Path( '/fake/appcore' )
         fs.create_dir( appcore_path )
-        mock_frame = MagicMock( )
-        mock_frame.f_code.co_filename = str( appcore_path / 'some_file.py' )
-        mock_frame.f_back = None
+        mock_frame = create_frame( appcore_path / 'some_file.py' )
         with (
             patch( 'inspect.currentframe', return_value = mock_frame ),
             patch( 'pathlib.Path.cwd', return_value = cwd )
@@ -356,6 +420,35 @@ def test_515_discover_invoker_location_no_frame( ):
         assert anchor.samefile( cwd )
 
 
+def test_516_discover_invoker_location_depth_limit( ):
+    ''' Invoker location discovery returns cwd beyond frame depth limit. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        cwd = Path( '/fake/cwd' )
+        fs.create_dir( cwd )
+        external_frame = create_frame(
+            '/fake/project/caller.py', mname = 'test.caller.module' )
+        frame = external_frame
+        for _ in range( module._invoker_frames_maximum ):
+            main_frame = create_frame(
+                '/some/path/script.py', mname = '__main__', back = frame )
+            frame = main_frame
+        appcore_frame = create_frame(
+            '/fake/appcore/distribution.py', back = frame )
+        with (
+            patch( 'inspect.currentframe', return_value = appcore_frame ),
+            patch( 'pathlib.Path.cwd', return_value = cwd ),
+            patch( 'site.getsitepackages', return_value = [ '/fake/site' ] ),
+            patch( 'site.getusersitepackages',
+                   return_value = '/fake/user/site' )
+        ): package, anchor = module._discover_invoker_location( )
+        # External frame lies beyond depth limit.
+        assert module.__.is_absent( package )
+        assert anchor.samefile( cwd )
+
+
 def test_517_discover_invoker_location_site_packages( ):
     ''' Invoker location discovery allows site-packages calling packages. '''
     from pyfakefs.fake_filesystem_unittest import Patcher
@@ -366,13 +459,10 @@ def test_517_discover_invoker_location_site_packages( ):
         fs.create_dir( site_packages )
         third_party_pkg = site_packages / 'third_party' / '__init__.py'
         fs.create_file( third_party_pkg, contents = '# third party package' )
-        external_frame = MagicMock( )
-        external_frame.f_code.co_filename = str( third_party_pkg )
-        external_frame.f_globals = { '__name__': 'third_party.module' }
-        external_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = '/fake/appcore/distribution.py'
-        appcore_frame.f_back = external_frame
+        external_frame = create_frame(
+            third_party_pkg, mname = 'third_party.module' )
+        appcore_frame = create_frame(
+            '/fake/appcore/distribution.py', back = external_frame )
         with (
             patch( 'inspect.currentframe', return_value = appcore_frame ),
             patch( 'site.getsitepackages',
@@ -394,16 +484,10 @@ def test_518_discover_invoker_location_name_detection( ):
         fs.create_dir( site_packages )
         installed_pkg = site_packages / 'installed_pkg' / 'module.py'
         fs.create_file( installed_pkg, contents = '# installed package' )
-        external_frame = MagicMock( )
-        external_frame.f_code.co_filename = str( installed_pkg )
         # Simulate installed package with __name__ attribute
-        external_frame.f_globals = {
-            '__name__': 'installed_pkg'
-        }
-        external_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = '/fake/appcore/distribution.py'
-        appcore_frame.f_back = external_frame
+        external_frame = create_frame( installed_pkg, mname = 'installed_pkg' )
+        appcore_frame = create_frame(
+            '/fake/appcore/distribution.py', back = external_frame )
         # Mock sys.modules to contain the package for boundary detection
         mock_pkg = MagicMock(
             __path__ = [ str( site_packages / 'installed_pkg' ) ] )
@@ -428,13 +512,9 @@ def test_519_discover_invoker_location_no_name( ):
         cwd = Path( '/fake/cwd' )
         fs.create_dir( cwd )
         # Create a frame with no __name__ or __main__
-        no_info_frame = MagicMock( )
-        no_info_frame.f_code.co_filename = '/some/path/script.py'
-        no_info_frame.f_globals = { '__name__': None }
-        no_info_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = '/fake/appcore/distribution.py'
-        appcore_frame.f_back = no_info_frame
+        no_info_frame = create_frame( '/some/path/script.py' )
+        appcore_frame = create_frame(
+            '/fake/appcore/distribution.py', back = no_info_frame )
         with (
             patch( 'inspect.currentframe', return_value = appcore_frame ),
             patch( 'pathlib.Path.cwd', return_value = cwd ),
@@ -498,13 +578,9 @@ def test_525_discover_invoker_location_main_module( ):
         fs = patcher.fs
         cwd = Path( '/fake/cwd' )
         fs.create_dir( cwd )
-        main_frame = MagicMock( )
-        main_frame.f_code.co_filename = '/some/path/script.py'
-        main_frame.f_globals = { '__name__': '__main__' }
-        main_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = '/fake/appcore/distribution.py'
-        appcore_frame.f_back = main_frame
+        main_frame = create_frame( '/some/path/script.py', mname = '__main__' )
+        appcore_frame = create_frame(
+            '/fake/appcore/distribution.py', back = main_frame )
         with (
             patch( 'inspect.currentframe', return_value = appcore_frame ),
             patch( 'pathlib.Path.cwd', return_value = cwd ),
@@ -518,32 +594,21 @@ def test_525_discover_invoker_location_main_module( ):
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures( 'no_installed_packages' )
 async def test_526_prepare_package_found_but_not_distributed( ):
     ''' Correctly handles package found but not in distributions. '''
-    import tempfile
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        project_root = Path( temp_dir )
-        pyproject_path = project_root / 'pyproject.toml'
-        pyproject_content = '''
-[project]
-name = "found-not-distributed"
-version = "1.0.0"
-'''
-        pyproject_path.write_text( pyproject_content )
-        package_location = Path( module.__file__ ).parent.resolve( )
-        external_frame = MagicMock( )
-        external_frame.f_code.co_filename = str( project_root / 'caller.py' )
-        external_frame.f_globals = { '__name__': 'mypackage' }
-        external_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = str(
-            package_location / 'some_file.py' )
-        appcore_frame.f_back = external_frame
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        project_root = Path( '/fake/project' )
+        create_fake_pyproject(
+            patcher.fs, project_root, 'found-not-distributed' )
+        external_frame = create_frame(
+            project_root / 'caller.py', mname = 'mypackage' )
+        appcore_frame = create_frame(
+            PACKAGE_LOCATION / 'some_file.py', back = external_frame )
         mock_pkg = MagicMock( __path__ = [ str( project_root ) ] )
         with (
-            # Package found but not in distributions (returns empty dict)
-            patch( 'importlib_metadata.packages_distributions',
-                   return_value = {} ),
             patch( 'inspect.currentframe', return_value = appcore_frame ),
             patch.dict( module.__.sys.modules, { 'mypackage': mock_pkg } )
         ):
@@ -554,7 +619,7 @@ version = "1.0.0"
             # Should trigger development mode (line 53->65)
             assert info.editable is True
             assert info.name == 'found-not-distributed'
-            assert info.location.resolve( ) == project_root.resolve( )
+            assert info.location == project_root
 
 
 def test_527_discover_invoker_location_stdlib_continue( ):
@@ -566,13 +631,10 @@ def test_527_discover_invoker_location_stdlib_continue( ):
         cwd = Path( '/fake/cwd' )
         fs.create_dir( cwd )
         # Create a frame from stdlib location (not in site-packages)
-        stdlib_frame = MagicMock( )
-        stdlib_frame.f_code.co_filename = '/usr/lib/python3.10/os.py'
-        stdlib_frame.f_globals = { '__name__': 'os' }
-        stdlib_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = '/fake/appcore/distribution.py'
-        appcore_frame.f_back = stdlib_frame
+        stdlib_frame = create_frame(
+            '/usr/lib/python3.10/os.py', mname = 'os' )
+        appcore_frame = create_frame(
+            '/fake/appcore/distribution.py', back = stdlib_frame )
         with (
             patch( 'inspect.currentframe', return_value = appcore_frame ),
             patch( 'pathlib.Path.cwd', return_value = cwd ),
@@ -609,13 +671,10 @@ def test_529_discover_invoker_location_boundary_absent( ):
         fs = patcher.fs
         cwd = Path( '/fake/cwd' )
         fs.create_dir( cwd )
-        absent_frame = MagicMock( )
-        absent_frame.f_code.co_filename = '/some/path/script.py'
-        absent_frame.f_globals = { '__name__': '__main__' }
-        absent_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = '/fake/appcore/distribution.py'
-        appcore_frame.f_back = absent_frame
+        absent_frame = create_frame(
+            '/some/path/script.py', mname = '__main__' )
+        appcore_frame = create_frame(
+            '/fake/appcore/distribution.py', back = absent_frame )
         with (
             patch( 'inspect.currentframe', return_value = appcore_frame ),
             patch( 'pathlib.Path.cwd', return_value = cwd ),
@@ -628,26 +687,8 @@ def test_529_discover_invoker_location_boundary_absent( ):
         assert anchor.samefile( cwd )
 
 
-def test_530_locate_pyproject_finds_in_current_dir( ):
-    ''' Finds pyproject.toml in current directory. '''
-    from pyfakefs.fake_filesystem_unittest import Patcher
-
-    with Patcher( ) as patcher:
-        fs = patcher.fs
-        project_root = Path( '/fake/project' )
-        pyproject_path = project_root / 'pyproject.toml'
-        fs.create_file( pyproject_path, contents = '''
-[project]
-name = "current-dir-test"
-version = "1.0.0"
-''' )
-        result = module._locate_pyproject( project_root )
-        assert result.samefile( project_root )
-        assert ( result / 'pyproject.toml' ).exists( )
-
-
-def test_530_locate_pyproject_finds_in_parent_dir( ):
-    ''' Finds pyproject.toml in parent directory. '''
+def test_530_locate_pyproject_finds_from_anchors( ):
+    ''' Finds pyproject.toml from current, nested, and file anchors. '''
     from pyfakefs.fake_filesystem_unittest import Patcher
 
     with Patcher( ) as patcher:
@@ -655,64 +696,32 @@ def test_530_locate_pyproject_finds_in_parent_dir( ):
         project_root = Path( '/fake/project' )
         nested_dir = project_root / 'level_0' / 'level_1' / 'level_2'
         fs.create_dir( nested_dir )
-        pyproject_path = project_root / 'pyproject.toml'
-        fs.create_file( pyproject_path, contents = '''
-[project]
-name = "parent-dir-test"
-version = "1.0.0"
-''' )
-        result = module._locate_pyproject( nested_dir )
-        assert result.samefile( project_root )
-        assert ( result / 'pyproject.toml' ).exists( )
-
-
-def test_540_locate_pyproject_handles_file_anchor( ):
-    ''' Finds pyproject.toml from anchor as file path. '''
-    from pyfakefs.fake_filesystem_unittest import Patcher
-
-    with Patcher( ) as patcher:
-        fs = patcher.fs
-        project_root = Path( '/fake/project' )
-        pyproject_path = project_root / 'pyproject.toml'
-        fs.create_file( pyproject_path, contents = '''
-[project]
-name = "file-anchor-test"
-version = "1.0.0"
-''' )
+        create_fake_pyproject( fs, project_root, 'anchors-test' )
         test_file = project_root / 'test.py'
         fs.create_file( test_file, contents = '# test file' )
-        result = module._locate_pyproject( test_file )
-        assert result.samefile( project_root )
-        assert ( result / 'pyproject.toml' ).exists( )
+        for anchor in ( project_root, nested_dir, test_file ):
+            result = module._locate_pyproject( anchor )
+            assert result.samefile( project_root )
+            assert ( result / 'pyproject.toml' ).exists( )
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures( 'no_installed_packages' )
 async def test_550_prepare_development_mode_without_anchor( ):
     ''' Finds pyproject.toml in development mode without anchor. '''
-    # Use real temporary directory for async file operations
-    import tempfile
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        project_root = Path( temp_dir )
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        project_root = Path( '/fake/project' )
         nested_dir = project_root / 'level_0' / 'level_1'
-        nested_dir.mkdir( parents = True, exist_ok = True )
-        pyproject_path = project_root / 'pyproject.toml'
-        pyproject_content = '''
-[project]
-name = "no-anchor-test"
-version = "1.0.0"
-'''
-        pyproject_path.write_text( pyproject_content )
-        package_location = Path( module.__file__ ).parent.resolve( )
-        external_frame = MagicMock( )
-        external_frame.f_code.co_filename = str( nested_dir / 'caller.py' )
-        external_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = str(
-            package_location / 'some_file.py' )
-        appcore_frame.f_back = external_frame
+        fs.create_dir( nested_dir )
+        create_fake_pyproject( fs, project_root, 'no-anchor-test' )
+        external_frame = create_frame(
+            nested_dir / 'caller.py', mname = 'caller' )
+        appcore_frame = create_frame(
+            PACKAGE_LOCATION / 'some_file.py', back = external_frame )
         with (
-            patch( 'importlib_metadata.packages_distributions',
-                   return_value = {} ),
             patch( 'inspect.currentframe', return_value = appcore_frame )
         ):
             exits = MagicMock( )
@@ -720,115 +729,120 @@ version = "1.0.0"
                 exits, package = 'nonexistent-package' )
             # Should find the project and return development mode
             assert info.name == 'no-anchor-test'
-            assert info.location.resolve( ) == project_root.resolve( )
+            assert info.location == project_root
             assert info.editable is True
 
 
+@pytest.mark.asyncio
+@pytest.mark.usefixtures( 'no_installed_packages' )
+async def test_555_prepare_walks_invoker_frames_once( ):
+    ''' Information.prepare reuses invoker discovery for anchor. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        project_root = Path( '/fake/project' )
+        nested_dir = project_root / 'level_0' / 'level_1'
+        fs.create_dir( nested_dir )
+        create_fake_pyproject( fs, project_root, 'no-anchor-test' )
+        external_frame = create_frame(
+            nested_dir / 'caller.py', mname = 'caller' )
+        appcore_frame = create_frame(
+            PACKAGE_LOCATION / 'some_file.py', back = external_frame )
+        with (
+            patch( 'inspect.currentframe',
+                   return_value = appcore_frame ) as currentframe,
+        ):
+            info = await module.Information.prepare( MagicMock( ) )
+        assert currentframe.call_count == 1
+        assert info.name == 'no-anchor-test'
+        assert info.location == project_root
+        assert info.editable is True
+
+
 def test_560_locate_pyproject_with_missing_file( ):
     ''' Project location raises FileLocateFailure when pyproject absent. '''
     from pyfakefs.fake_filesystem_unittest import Patcher
 
     with Patcher( ) as patcher:
         fs = patcher.fs
-        temp_path = Path( '/fake/empty' )
-        fs.create_dir( temp_path )
-        with pytest.raises( exceptions_module.FileLocateFailure ) as exc_info:
-            module._locate_pyproject( temp_path )
-        assert 'pyproject.toml' in str( exc_info.value )
-        assert 'project root discovery' in str( exc_info.value )
+        empty_dir = Path( '/fake/empty' )
+        fs.create_dir( empty_dir )
+        # Deep directory traverses all the way to filesystem root.
+        deep_dir = Path( '/fake/very/deep/directory/structure' )
+        fs.create_dir( deep_dir )
+        for anchor in ( empty_dir, deep_dir ):
+            with pytest.raises(
+                exceptions_module.FileLocateFailure,
+                match = PYPROJECT_ABSENCE_PATTERN
+            ): module._locate_pyproject( anchor )
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures( 'no_installed_packages' )
 async def test_570_prepare_development_mode_with_anchor( ):
     ''' Information.prepare works in development mode with provided anchor. '''
-    # Use real temporary directory for async file operations
-    import tempfile
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        project_root = Path( temp_dir )
-        pyproject_path = project_root / 'pyproject.toml'
-        pyproject_content = '''
-[project]
-name = "anchor-test"
-version = "1.0.0"
-'''
-        pyproject_path.write_text( pyproject_content )
-        with patch( 'importlib_metadata.packages_distributions',
-                   return_value = {} ):
-            exits = MagicMock( )
-            # Call prepare WITH project_anchor - should NOT trigger
-            # _discover_invoker_location
-            info = await module.Information.prepare(
-                exits, anchor = project_root, package = 'nonexistent-package' )
-            # Should find the project and return development mode
-            assert info.name == 'anchor-test'
-            assert info.location.resolve( ) == project_root.resolve( )
-            assert info.editable is True
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        project_root = Path( '/fake/project' )
+        create_fake_pyproject( fs, project_root, 'anchor-test' )
+        exits = MagicMock( )
+        # Call prepare WITH project_anchor - should NOT trigger
+        # _discover_invoker_location
+        info = await module.Information.prepare(
+            exits, anchor = project_root, package = 'nonexistent-package' )
+        # Should find the project and return development mode
+        assert info.name == 'anchor-test'
+        assert info.location == project_root
+        assert info.editable is True
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures( 'no_installed_packages' )
 async def test_580_prepare_development_mode_no_anchor_absent( ):
     ''' Information.prepare development mode when project_anchor is absent. '''
-    # Use real temporary directory for async file operations
-    import tempfile
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        project_root = Path( temp_dir )
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        project_root = Path( '/fake/project' )
         nested_dir = project_root / 'caller_location'
-        nested_dir.mkdir( parents = True, exist_ok = True )
-        pyproject_path = project_root / 'pyproject.toml'
-        pyproject_content = '''
-[project]
-name = "absent-anchor-test"
-version = "1.0.0"
-'''
-        pyproject_path.write_text( pyproject_content )
-        package_location = Path( module.__file__ ).parent.resolve( )
-        external_frame = MagicMock( )
-        external_frame.f_code.co_filename = str( nested_dir / 'caller.py' )
-        external_frame.f_back = None
-        appcore_frame = MagicMock( )
-        appcore_frame.f_code.co_filename = str(
-            package_location / 'some_file.py' )
-        appcore_frame.f_back = external_frame
+        fs.create_dir( nested_dir )
+        create_fake_pyproject( fs, project_root, 'absent-anchor-test' )
+        external_frame = create_frame(
+            nested_dir / 'caller.py', mname = 'caller' )
+        appcore_frame = create_frame(
+            PACKAGE_LOCATION / 'some_file.py', back = external_frame )
         with (
-            patch( 'importlib_metadata.packages_distributions',
-                   return_value = {} ),
             patch( 'inspect.currentframe', return_value = appcore_frame )
         ):
             exits = MagicMock( )
             info = await module.Information.prepare(
                 exits, package = 'nonexistent-package' )
             assert info.name == 'absent-anchor-test'
-            assert info.location.resolve( ) == project_root.resolve( )
+            assert info.location == project_root
             assert info.editable is True
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures( 'no_installed_packages' )
 async def test_590_prepare_development_mode_missing_package( ):
     ''' Information.prepare triggers development mode for missing package. '''
-    # Test the critical development mode path (lines 52-55 in distribution.py)
-    import tempfile
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        project_root = Path( temp_dir )
-        pyproject_path = project_root / 'pyproject.toml'
-        pyproject_content = '''
-[project]
-name = "development-mode-test"
-version = "1.0.0"
-'''
-        pyproject_path.write_text( pyproject_content )
-        # Mock packages_distributions to return empty
-        # (no installed package found)
-        # This triggers the development mode path when name is None
-        with patch(
-            'importlib_metadata.packages_distributions', return_value = {}
-        ):
-            exits = MagicMock( )
-            # This should trigger development mode because package not found
-            info = await module.Information.prepare(
-                exits, anchor = project_root, package = 'nonexistent-package' )
-            assert info.editable is True
-            assert info.name == 'development-mode-test'
-            assert info.location.resolve( ) == project_root.resolve( )
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        fs = patcher.fs
+        project_root = Path( '/fake/project' )
+        create_fake_pyproject( fs, project_root, 'development-mode-test' )
+        exits = MagicMock( )
+        # This should trigger development mode because package not found
+        info = await module.Information.prepare(
+            exits, anchor = project_root, package = 'nonexistent-package' )
+        assert info.editable is True
+        assert info.name == 'development-mode-test'
+        assert info.location == project_root
 
 
 def test_590_locate_pyproject_with_git_ceiling_directories( ):
@@ -841,21 +855,16 @@ def test_590_locate_pyproject_with_git_ceiling_directories( ):
         project_root = ceiling_dir / 'project'
         nested_dir = project_root / 'nested'
         fs.create_dir( nested_dir )
-        upper_pyproject = Path( '/fake/pyproject.toml' )
-        fs.create_file( upper_pyproject, contents = '''
-[project]
-name = "upper-project"
-version = "1.0.0"
-''' )
+        create_fake_pyproject( fs, Path( '/fake' ), 'upper-project' )
         # Set GIT_CEILING_DIRECTORIES to the ceiling directory
-        with patch.dict(
-            os.environ, { 'GIT_CEILING_DIRECTORIES': str( ceiling_dir ) }
-        ):
-            with pytest.raises( exceptions_module.FileLocateFailure ) as (
-                exc_info ):
-                module._locate_pyproject( nested_dir )
-            assert 'pyproject.toml' in str( exc_info.value )
-            assert 'project root discovery' in str( exc_info.value )
+        with (
+            patch.dict(
+                os.environ,
+                { 'GIT_CEILING_DIRECTORIES': str( ceiling_dir ) } ),
+            pytest.raises(
+                exceptions_module.FileLocateFailure,
+                match = PYPROJECT_ABSENCE_PATTERN ),
+        ): module._locate_pyproject( nested_dir )
 
 
 def test_600_locate_pyproject_with_empty_ceiling_directories( ):
@@ -867,12 +876,7 @@ def test_600_locate_pyproject_with_empty_ceiling_directories( ):
         project_root = Path( '/fake/project' )
         nested_dir = project_root / 'nested'
         fs.create_dir( nested_dir )
-        pyproject_path = project_root / 'pyproject.toml'
-        fs.create_file( pyproject_path, contents = '''
-[project]
-name = "empty-ceiling-test"
-version = "1.0.0"
-''' )
+        create_fake_pyproject( fs, project_root, 'empty-ceiling-test' )
         # Set GIT_CEILING_DIRECTORIES to empty string
         with patch.dict( os.environ, { 'GIT_CEILING_DIRECTORIES': '' } ):
             result = module._locate_pyproject( nested_dir )
@@ -880,20 +884,6 @@ version = "1.0.0"
             assert ( result / 'pyproject.toml' ).exists( )
 
 
-def test_610_locate_pyproject_filesystem_root_traversal( ):
-    ''' Project location raises FileLocateFailure at filesystem root. '''
-    from pyfakefs.fake_filesystem_unittest import Patcher
-
-    with Patcher( ) as patcher:
-        fs = patcher.fs
-        deep_dir = Path( '/fake/very/deep/directory/structure' )
-        fs.create_dir( deep_dir )
-        with pytest.raises( exceptions_module.FileLocateFailure ) as exc_info:
-            module._locate_pyproject( deep_dir )
-        assert 'pyproject.toml' in str( exc_info.value )
-        assert 'project root discovery' in str( exc_info.value )
-
-
 @pytest.mark.asyncio
 async def test_615_prepare_with_auto_detection( ):
     ''' Distribution preparation auto-detects calling package. '''
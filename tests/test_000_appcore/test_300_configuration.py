@@ -22,18 +22,15 @@
 
 
 import io
-import tempfile
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
 from .__ import PACKAGE_NAME, cache_import_module
-from .fixtures import (
-    create_config_template_files,
-    create_temp_directories_and_distribution,
-)
+from .fixtures import ReadsRecorder, create_config_template_files
 
 MODULE_QNAME = f"{PACKAGE_NAME}.configuration"
 module = cache_import_module( MODULE_QNAME )
@@ -43,37 +40,66 @@ distribution_module = cache_import_module( f"{PACKAGE_NAME}.distribution" )
 exceptions_module = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
 
 
-def test_100_enablement_tristate_disable( ):
-    ''' EnablementTristate.Disable converts to False. '''
-    state = module.EnablementTristate.Disable
-    assert bool( state ) is False
+@pytest.fixture( autouse = True )
+def clear_configuration_caches( ):
+    ''' Clears module caches so that each test parses its own files. '''
+    module._toml_data_cache.clear( )
 
 
-def test_110_enablement_tristate_enable( ):
-    ''' EnablementTristate.Enable converts to True. '''
-    state = module.EnablementTristate.Enable
-    assert bool( state ) is True
+@pytest.fixture( scope = 'module' )
+def empty_directories( tmp_path_factory ):
+    ''' Provides platform directories with empty user configuration. '''
+    return SimpleNamespace(
+        user_config_path = tmp_path_factory.mktemp( 'config' ) )
 
 
-def test_120_enablement_tristate_retain_error( ):
-    ''' EnablementTristate.Retain raises error on boolean conversion. '''
-    state = module.EnablementTristate.Retain
-    with pytest.raises( exceptions_module.OperationInvalidity ):
-        bool( state )
+@pytest.fixture( scope = 'module' )
+def inert_distribution( ):
+    ''' Provides distribution stand-in for tests which never consult it. '''
+    return MagicMock( spec = [ ] )
 
 
-def test_130_enablement_tristate_is_retain( ):
-    ''' EnablementTristate.is_retain identifies retain state. '''
-    assert module.EnablementTristate.Retain.is_retain( ) is True
-    assert module.EnablementTristate.Enable.is_retain( ) is False
-    assert module.EnablementTristate.Disable.is_retain( ) is False
+@pytest.fixture( scope = 'module' )
+def acquirer( ):
+    ''' Provides configuration acquirer with default settings. '''
+    return module.TomlAcquirer( )
 
 
-def test_140_enablement_tristate_values( ):
-    ''' EnablementTristate has expected string values. '''
-    assert module.EnablementTristate.Disable.value == 'disable'
-    assert module.EnablementTristate.Retain.value == 'retain'
-    assert module.EnablementTristate.Enable.value == 'enable'
+@pytest.fixture
+def fake_distribution( ):
+    ''' Provides directories and distribution on fake filesystem. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        user_config_path = Path( '/fake/config' )
+        patcher.fs.create_dir( user_config_path )
+        directories = SimpleNamespace( user_config_path = user_config_path )
+        distribution = distribution_module.Information(
+            name = 'test-dist', location = Path( '/fake/dist' ),
+            editable = False )
+        yield directories, distribution
+
+
+@pytest.mark.parametrize(
+    'name, value, truth',
+    (
+        ( 'Disable', 'disable', False ),
+        ( 'Enable', 'enable', True ),
+        ( 'Retain', 'retain', None ),
+    )
+)
+def test_100_enablement_tristate( name, value, truth ):
+    ''' EnablementTristate has values, retain checks, and truth values.
+
+        Retain has no truth value; boolean conversion raises error.
+    '''
+    state = getattr( module.EnablementTristate, name )
+    assert state.value == value
+    assert state.is_retain( ) is ( truth is None )
+    if truth is None:
+        with pytest.raises( exceptions_module.OperationInvalidity ):
+            bool( state )
+    else: assert bool( state ) is truth
 
 
 def test_200_toml_acquirer_creation( ):
@@ -95,16 +121,17 @@ def test_210_toml_acquirer_custom_values( ):
 
 def test_220_toml_acquirer_protocol_compliance( ):
     ''' Configuration acquirer implements AcquirerAbc protocol. '''
-    acquirer = module.TomlAcquirer( )
-    # Check that TomlAcquirer has the required protocol methods
-    assert hasattr( acquirer, '__call__' )
-    assert callable( acquirer )
-    # Check that it's a dataclass (protocol requirement)
-    assert hasattr( acquirer, '__dataclass_fields__' )
+    from dataclasses import is_dataclass
+    # Protocol is inherited explicitly; dataclass is protocol requirement
+    assert module.AcquirerAbc in module.TomlAcquirer.__mro__
+    assert callable( module.TomlAcquirer( ) )
+    assert is_dataclass( module.TomlAcquirer )
 
 
 @pytest.mark.asyncio
-async def test_300_toml_acquirer_call_with_text_io( ):
+async def test_300_toml_acquirer_call_with_text_io(
+    empty_directories, inert_distribution, acquirer
+):
     ''' Configuration acquirer processes configuration from TextIO. '''
     toml_content = '''
 [app]
@@ -116,9 +143,8 @@ host = "localhost"
 port = 5432
     '''
     file_io = io.StringIO( toml_content )
-    directories = MagicMock( )
-    distribution = MagicMock( )
-    acquirer = module.TomlAcquirer( )
+    directories = empty_directories
+    distribution = inert_distribution
     result = await acquirer(
         'test-app',
         directories,
@@ -132,37 +158,108 @@ port = 5432
 
 
 @pytest.mark.asyncio
-async def test_310_toml_acquirer_call_with_path( ):
+async def test_310_toml_acquirer_call_with_path(
+    empty_directories, inert_distribution, acquirer
+):
     ''' Configuration acquirer processes configuration from file path. '''
     toml_content = '''
 [app]
 name = "path-app"
 debug = true
     '''
-    with tempfile.NamedTemporaryFile( mode = 'w', suffix = '.toml',
-                                      delete = False ) as tmp_file:
-        tmp_file.write( toml_content )
-        tmp_file_path = Path( tmp_file.name )
-    try:
-        directories = MagicMock( )
-        distribution = MagicMock( )
-
-        acquirer = module.TomlAcquirer( )
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        file_path = Path( '/fake/config/path-app.toml' )
+        patcher.fs.create_file( file_path, contents = toml_content )
+        directories = empty_directories
+        distribution = inert_distribution
+
         result = await acquirer(
             'path-app',
             directories,
             distribution,
-            file = tmp_file_path
+            file = file_path
         )
 
         assert result[ 'app' ][ 'name' ] == 'path-app'
         assert result[ 'app' ][ 'debug' ] is True
-    finally:
-        tmp_file_path.unlink( )
 
 
 @pytest.mark.asyncio
-async def test_320_toml_acquirer_call_with_edits( ):
+async def test_315_toml_acquirer_caches_parsed_file(
+    empty_directories, inert_distribution, acquirer
+):
+    ''' Configuration acquirer reuses parse until file changes. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        file_path = Path( '/fake/config/cached-app.toml' )
+        patcher.fs.create_file(
+            file_path, contents = '[app]\nname = "cached-app"\n' )
+        directories = empty_directories
+        distribution = inert_distribution
+        result1 = await acquirer(
+            'cached-app', directories, distribution, file = file_path )
+        result1[ 'app' ][ 'name' ] = 'mutated'
+        result2 = await acquirer(
+            'cached-app', directories, distribution, file = file_path )
+        assert result2[ 'app' ][ 'name' ] == 'cached-app'
+        file_path.write_text( '[app]\nname = "changed-app"\n' )
+        status = patcher.fs.stat( file_path )
+        patcher.fs.utime(
+            file_path, ns = ( status.st_atime_ns, status.st_mtime_ns + 1 ) )
+        result3 = await acquirer(
+            'cached-app', directories, distribution, file = file_path )
+        assert result3[ 'app' ][ 'name' ] == 'changed-app'
+
+
+@pytest.mark.asyncio
+async def test_316_toml_acquirer_evicts_oldest_parse(
+    empty_directories, inert_distribution, acquirer
+):
+    ''' Configuration acquirer evicts oldest parse when cache is full. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    cache = module._toml_data_cache
+    dummies = tuple(
+        f"/dummy/{index}.toml"
+        for index in range( module._toml_data_cache_maximum ) )
+    for dummy in dummies: cache[ dummy ] = ( ( 0, ), { } )
+    with Patcher( ) as patcher:
+        file_path = Path( '/fake/config/evicting-app.toml' )
+        patcher.fs.create_file(
+            file_path, contents = '[app]\nname = "evicting-app"\n' )
+        await acquirer(
+            'evicting-app', empty_directories, inert_distribution,
+            file = file_path )
+    assert dummies[ 0 ] not in cache
+    assert dummies[ 1 ] in cache
+    assert str( file_path ) in cache
+    assert len( cache ) == module._toml_data_cache_maximum
+
+
+@pytest.mark.asyncio
+async def test_317_toml_acquirer_call_with_malformed_file(
+    empty_directories, inert_distribution, acquirer
+):
+    ''' Configuration acquirer propagates parse error for main file. '''
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        file_path = Path( '/fake/config/malformed.toml' )
+        patcher.fs.create_file( file_path, contents = '[app\n' )
+        with pytest.raises( module.__.tomllib.TOMLDecodeError ):
+            await acquirer(
+                'malformed', empty_directories, inert_distribution,
+                file = file_path )
+        assert not module._toml_data_cache
+
+
+@pytest.mark.asyncio
+async def test_320_toml_acquirer_call_with_edits(
+    empty_directories, inert_distribution, acquirer
+):
     ''' Configuration acquirer applies edits to configuration. '''
     toml_content = '''
 [app]
@@ -170,14 +267,13 @@ name = "test-app"
 version = "1.0.0"
     '''
     file_io = io.StringIO( toml_content )
-    directories = MagicMock( )
-    distribution = MagicMock( )
+    directories = empty_directories
+    distribution = inert_distribution
     # Create edit to modify version
     edit = dictedits_module.SimpleEdit(
         address = [ 'app', 'version' ],
         value = '2.0.0'
     )
-    acquirer = module.TomlAcquirer( )
     result = await acquirer(
         'test-app',
         directories,
@@ -190,11 +286,11 @@ version = "1.0.0"
 
 
 @pytest.mark.asyncio
-async def test_325_toml_acquirer_call_with_absent_file( ):
+async def test_325_toml_acquirer_call_with_absent_file(
+    fake_distribution, acquirer
+):
     ''' Configuration acquirer handles absent file by discovering template. '''
-    # Create temp directories and distribution with template file
-    directories, distribution, temp_dir = (
-        create_temp_directories_and_distribution( ) )
+    directories, distribution = fake_distribution
     template_content = '''
 [app]
 name = "discovered-app"
@@ -206,33 +302,27 @@ version = "1.0.0"
         main_filename = 'general.toml',
         content = template_content
     )
-    try:
-        acquirer = module.TomlAcquirer( )
-
-        result = await acquirer(
-            'test-app',
-            directories,
-            distribution,
-            file = module.__.absent
-        )
-
-        # Verify configuration was loaded from discovered template
-        assert result[ 'app' ][ 'name' ] == 'discovered-app'
-        assert result[ 'app' ][ 'version' ] == '1.0.0'
+    result = await acquirer(
+        'test-app',
+        directories,
+        distribution,
+        file = module.__.absent
+    )
 
-        # Verify template was copied to user config directory
-        user_config_file = directories.user_config_path / 'general.toml'
-        assert user_config_file.exists( )
-        assert 'discovered-app' in user_config_file.read_text( )
+    # Verify configuration was loaded from discovered template
+    assert result[ 'app' ][ 'name' ] == 'discovered-app'
+    assert result[ 'app' ][ 'version' ] == '1.0.0'
 
-    finally:
-        # Clean up temp directory
-        import shutil
-        shutil.rmtree( temp_dir )
+    # Verify template was copied to user config directory
+    user_config_file = directories.user_config_path / 'general.toml'
+    assert user_config_file.exists( )
+    assert 'discovered-app' in user_config_file.read_text( )
 
 
 @pytest.mark.asyncio
-async def test_330_toml_acquirer_call_with_includes( ):
+async def test_330_toml_acquirer_call_with_includes(
+    empty_directories, inert_distribution, acquirer
+):
     ''' Configuration acquirer processes includes configuration structure. '''
     toml_content = '''
 [app]
@@ -243,10 +333,9 @@ includes = [
 ]
     '''
     file_io = io.StringIO( toml_content )
-    directories = MagicMock( )
-    distribution = MagicMock( )
+    directories = empty_directories
+    distribution = inert_distribution
     # The actual includes processing would require real files
-    acquirer = module.TomlAcquirer( )
     result = await acquirer(
         'test-app',
         directories,
@@ -260,7 +349,7 @@ includes = [
 
 
 @pytest.mark.asyncio
-async def test_340_toml_acquirer_discover_copy_template( ):
+async def test_340_toml_acquirer_discover_copy_template( acquirer ):
     ''' Configuration acquirer discovers and copies template file. '''
     from pyfakefs.fake_filesystem_unittest import Patcher
 
@@ -269,21 +358,17 @@ async def test_340_toml_acquirer_discover_copy_template( ):
         temp_path = Path( '/fake/config' )
         fs.create_dir( temp_path )
 
-        directories = MagicMock( )
-        directories.user_config_path = temp_path
-
-        distribution = MagicMock( )
-        distribution.provide_data_location.return_value = (
-            temp_path / 'template.toml' )
+        directories = SimpleNamespace( user_config_path = temp_path )
 
         # Create template file
         template_file = temp_path / 'template.toml'
+        distribution = SimpleNamespace(
+            provide_data_location = lambda *appendages: template_file )
         fs.create_file( template_file, contents = '''
 [app]
 name = "template-app"
         ''' )
 
-        acquirer = module.TomlAcquirer( )
         result_path = acquirer._discover_copy_template(
             directories, distribution )
 
@@ -294,35 +379,28 @@ name = "template-app"
 
 
 @pytest.mark.asyncio
-async def test_345_toml_acquirer_call_with_no_template( ):
+async def test_345_toml_acquirer_call_with_no_template(
+    fake_distribution, acquirer
+):
     ''' Configuration acquirer returns empty dict when no template exists. '''
-    # Create temp directories and distribution WITHOUT template file
-    directories, distribution, temp_dir = (
-        create_temp_directories_and_distribution( ) )
-
-    try:
-        acquirer = module.TomlAcquirer( )
-
-        result = await acquirer(
-            'test-app',
-            directories,
-            distribution
-        )
-
-        # Should return empty configuration when no template exists
-        assert len( result ) == 0
+    # Distribution data location has no template file
+    directories, distribution = fake_distribution
+    result = await acquirer(
+        'test-app',
+        directories,
+        distribution
+    )
 
-        # User config file should not be created when no template exists
-        config_file = directories.user_config_path / 'general.toml'
-        assert not config_file.exists( )
+    # Should return empty configuration when no template exists
+    assert len( result ) == 0
 
-    finally:
-        import shutil
-        shutil.rmtree( temp_dir )
+    # User config file should not be created when no template exists
+    config_file = directories.user_config_path / 'general.toml'
+    assert not config_file.exists( )
 
 
 @pytest.mark.asyncio
-async def test_350_toml_acquirer_discover_existing_file( ):
+async def test_350_toml_acquirer_discover_existing_file( acquirer ):
     ''' Configuration acquirer uses existing file when it exists. '''
     from pyfakefs.fake_filesystem_unittest import Patcher
 
@@ -331,10 +409,9 @@ async def test_350_toml_acquirer_discover_existing_file( ):
         temp_path = Path( '/fake/config' )
         fs.create_dir( temp_path )
 
-        directories = MagicMock( )
-        directories.user_config_path = temp_path
+        directories = SimpleNamespace( user_config_path = temp_path )
 
-        distribution = MagicMock( )
+        distribution = MagicMock( spec = [ 'provide_data_location' ] )
 
         # Create existing file
         existing_file = temp_path / 'general.toml'
@@ -343,7 +420,6 @@ async def test_350_toml_acquirer_discover_existing_file( ):
 name = "existing-app"
         ''' )
 
-        acquirer = module.TomlAcquirer( )
         result_path = acquirer._discover_copy_template(
             directories, distribution )
 
@@ -353,10 +429,13 @@ name = "existing-app"
 
 
 @pytest.mark.asyncio
-async def test_360_toml_acquirer_acquire_includes_with_files( ):
+async def test_360_toml_acquirer_acquire_includes_with_files( acquirer ):
     ''' TomlAcquirer._acquire_includes processes file specifications. '''
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        temp_path = Path( temp_dir )
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        temp_path = Path( '/fake/config' )
+        patcher.fs.create_dir( temp_path )
 
         # Create include files
         include1 = temp_path / 'include1.toml'
@@ -371,12 +450,10 @@ host = "db1.example.com"
 host = "cache.example.com"
         ''' )
 
-        directories = MagicMock( )
-        directories.user_config_path = temp_path
+        directories = SimpleNamespace( user_config_path = temp_path )
 
         specs = ( str( temp_path ), )
 
-        acquirer = module.TomlAcquirer( )
         result = await acquirer._acquire_includes(
             'test-app', directories, specs )
 
@@ -393,10 +470,30 @@ host = "cache.example.com"
 
 
 @pytest.mark.asyncio
-async def test_370_toml_acquirer_acquire_includes_with_directories( ):
+async def test_365_toml_acquirer_acquire_includes_concurrently(
+    empty_directories, acquirer
+):
+    ''' TomlAcquirer._acquire_includes reads include files concurrently. '''
+    from unittest.mock import patch
+    recorder = ReadsRecorder(
+        lambda file: f"[{Path( file ).stem}]\nread = true\n" )
+    specs = ( '/absent/first.toml', '/absent/second.toml' )
+    with patch( 'aiofiles.open', recorder ):
+        result = await acquirer._acquire_includes(
+            'test-app', empty_directories, specs )
+    assert tuple( result ) == (
+        { 'first': { 'read': True } }, { 'second': { 'read': True } } )
+    assert recorder.peak == len( specs )
+
+
+@pytest.mark.asyncio
+async def test_370_toml_acquirer_acquire_includes_with_directories( acquirer ):
     ''' TomlAcquirer._acquire_includes processes directory specifications. '''
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        temp_path = Path( temp_dir )
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        temp_path = Path( '/fake/config' )
+        patcher.fs.create_dir( temp_path )
 
         # Create include directory with files
         include_dir = temp_path / 'includes'
@@ -412,13 +509,15 @@ name = "service1"
 port = 8080
         ''' )
 
-        directories = MagicMock( )
-        directories.user_config_path = temp_path
+        # Non-TOML files and subdirectories are skipped
+        ( include_dir / 'notes.txt' ).write_text( 'not toml' )
+        ( include_dir / 'nested.toml' ).mkdir( )
+
+        directories = SimpleNamespace( user_config_path = temp_path )
 
         # Use directory spec
         specs = ( str( include_dir ), )
 
-        acquirer = module.TomlAcquirer( )
         result = await acquirer._acquire_includes(
             'test-app', directories, specs )
 
@@ -436,14 +535,28 @@ port = 8080
 
 
 @pytest.mark.asyncio
-async def test_380_toml_acquirer_acquire_includes_with_formatting( ):
+async def test_375_toml_acquirer_acquire_includes_unreadable_directory(
+    empty_directories, acquirer
+):
+    ''' TomlAcquirer._acquire_includes skips unreadable directories. '''
+    from unittest.mock import patch
+    with patch( 'os.scandir', side_effect = PermissionError ):
+        result = await acquirer._acquire_includes(
+            'test-app', empty_directories, ( '/unreadable/includes', ) )
+    assert tuple( result ) == ( )
+
+
+@pytest.mark.asyncio
+async def test_380_toml_acquirer_acquire_includes_with_formatting( acquirer ):
     ''' TomlAcquirer._acquire_includes formats path specifications. '''
-    with tempfile.TemporaryDirectory( ) as temp_dir:
-        temp_path = Path( temp_dir )
+    from pyfakefs.fake_filesystem_unittest import Patcher
+
+    with Patcher( ) as patcher:
+        temp_path = Path( '/fake/config' )
+        patcher.fs.create_dir( temp_path )
         # home_path = Path.home( )  # Not used
 
-        directories = MagicMock( )
-        directories.user_config_path = temp_path
+        directories = SimpleNamespace( user_config_path = temp_path )
 
         # Create a file using formatted path
         formatted_dir = temp_path / 'test-app'
@@ -457,7 +570,6 @@ value = "success"
         # Use formatted specification
         specs = ( '{user_configuration}/test-app/app.toml', )
 
-        acquirer = module.TomlAcquirer( )
         result = await acquirer._acquire_includes(
             'test-app', directories, specs )
 
@@ -466,13 +578,15 @@ value = "success"
 
 
 @pytest.mark.asyncio
-async def test_390_toml_acquirer_acquire_includes_empty_specs( ):
+async def test_390_toml_acquirer_acquire_includes_empty_specs(
+    empty_directories, acquirer
+):
     ''' TomlAcquirer._acquire_includes handles empty specifications. '''
-    directories = MagicMock( )
-    acquirer = module.TomlAcquirer( )
+    directories = empty_directories
     result = await acquirer._acquire_includes( 'test-app', directories, ( ) )
     assert len( result ) == 0
 
+
 def test_400_acquirer_abc_protocol( ):
     ''' AcquirerAbc is a proper protocol class. '''
     assert hasattr( module.AcquirerAbc, '__call__' )
@@ -492,21 +606,22 @@ def test_410_toml_acquirer_immutability( ):
         acquirer.main_filename = 'modified.toml'  # type: ignore
 
 
-def test_420_toml_acquirer_equality( ):
-    ''' TomlAcquirer instances with same data are equal. '''
-    acquirer1 = module.TomlAcquirer(
-        main_filename = 'test.toml',
-        includes_name = 'test_includes'
-    )
-    acquirer2 = module.TomlAcquirer(
-        main_filename = 'test.toml',
-        includes_name = 'test_includes'
+@pytest.mark.parametrize(
+    'arguments1, arguments2, equal',
+    (
+        (   dict(
+                main_filename = 'test.toml', includes_name = 'test_includes' ),
+            dict(
+                main_filename = 'test.toml', includes_name = 'test_includes' ),
+            True ),
+        (   dict( main_filename = 'test.toml' ),
+            dict( main_filename = 'other.toml' ),
+            False ),
     )
-    assert acquirer1 == acquirer2
-
-
-def test_430_toml_acquirer_inequality( ):
-    ''' TomlAcquirer instances with different data are not equal. '''
-    acquirer1 = module.TomlAcquirer( main_filename = 'test.toml' )
-    acquirer2 = module.TomlAcquirer( main_filename = 'other.toml' )
-    assert acquirer1 != acquirer2
+)
+def test_420_toml_acquirer_equality( arguments1, arguments2, equal ):
+    ''' TomlAcquirer instances are equal when their data are equal. '''
+    acquirer1 = module.TomlAcquirer( **arguments1 )
+    acquirer2 = module.TomlAcquirer( **arguments2 )
+    assert ( acquirer1 == acquirer2 ) is equal
+    assert ( acquirer1 != acquirer2 ) is not equal
@@ -24,6 +24,7 @@
 import dataclasses
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -36,6 +37,24 @@ module = cache_import_module( MODULE_QNAME )
 application_module = cache_import_module( f"{PACKAGE_NAME}.application" )
 distribution_module = cache_import_module( f"{PACKAGE_NAME}.distribution" )
 
+APPLICATION = application_module.Information( name = 'test-app' )
+DISTRIBUTION = distribution_module.Information(
+    name = 'test-dist', location = Path( '/test' ), editable = True )
+
+
+@pytest.fixture( scope = 'module' )
+def baseline_globals( ):
+    ''' Provides globals for test application. Derive to vary fields. '''
+    return module.Globals(
+        application = APPLICATION,
+        configuration = { 'app': { 'name': 'test' } },
+        directories = SimpleNamespace(
+            user_cache_path = Path( '/user/cache/test-app' ),
+            user_data_path = Path( '/user/data/test-app' ),
+            user_state_path = Path( '/user/state/test-app' ) ),
+        distribution = DISTRIBUTION,
+        exits = MagicMock( ) )
+
 
 def test_100_directory_species_values( ):
     ''' DirectorySpecies has expected string values. '''
@@ -53,182 +72,76 @@ def test_110_directory_species_enum_members( ):
 
 def test_200_globals_creation( ):
     ''' Globals creates with all required fields. '''
-    application = application_module.Information( name = 'test-app' )
     configuration = { 'app': { 'name': 'test' } }
     directories = MagicMock( )
-    distribution = distribution_module.Information(
-        name = 'test-dist',
-        location = Path( '/test' ),
-        editable = True
-    )
     exits = MagicMock( )
     globals_obj = module.Globals(
-        application = application,
+        application = APPLICATION,
         configuration = configuration,
         directories = directories,
-        distribution = distribution,
+        distribution = DISTRIBUTION,
         exits = exits
     )
-    assert globals_obj.application == application
+    assert globals_obj.application == APPLICATION
     assert globals_obj.configuration == configuration
     assert globals_obj.directories == directories
-    assert globals_obj.distribution == distribution
+    assert globals_obj.distribution == DISTRIBUTION
     assert globals_obj.exits == exits
 
 
-def test_210_globals_as_dictionary( ):
+def test_210_globals_as_dictionary( baseline_globals ):
     ''' Globals.as_dictionary returns shallow copy of state. '''
-    application = application_module.Information( name = 'test-app' )
-    configuration = { 'app': { 'name': 'test' } }
-    directories = MagicMock( )
-    distribution = distribution_module.Information(
-        name = 'test-dist',
-        location = Path( '/test' ),
-        editable = True
-    )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    result = globals_obj.as_dictionary( )
-    assert 'application' in result
-    assert 'configuration' in result
-    assert 'directories' in result
-    assert 'distribution' in result
-    assert 'exits' in result
-    assert result[ 'application' ] == application
-    assert result[ 'configuration' ] == configuration
-    assert result[ 'directories' ] == directories
-    assert result[ 'distribution' ] == distribution
-    assert result[ 'exits' ] == exits
-
-
-def test_220_globals_as_dictionary_immutable( ):
+    result = baseline_globals.as_dictionary( )
+    for name in (
+        'application', 'configuration', 'directories', 'distribution', 'exits'
+    ): assert result[ name ] is getattr( baseline_globals, name )
+
+
+def test_220_globals_as_dictionary_immutable( baseline_globals ):
     ''' Globals.as_dictionary returns copy, not reference. '''
-    application = application_module.Information( name = 'test-app' )
-    configuration = { 'app': { 'name': 'test' } }
-    directories = MagicMock( )
-    distribution = distribution_module.Information(
-        name = 'test-dist',
-        location = Path( '/test' ),
-        editable = True
-    )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    result = globals_obj.as_dictionary( )
+    result = baseline_globals.as_dictionary( )
     # Modifying the returned dictionary should not affect the original
     result[ 'new_field' ] = 'new_value'
     # Original should not have the new field
-    assert not hasattr( globals_obj, 'new_field' )
+    assert not hasattr( baseline_globals, 'new_field' )
 
 
-def test_300_globals_provide_cache_location_basic( ):
-    ''' Globals.provide_cache_location returns cache directory. '''
-    application = application_module.Information( name = 'test-app' )
-    configuration = { }
-    directories = MagicMock( )
-    directories.user_cache_path = Path( '/user/cache/test-app' )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
+@pytest.mark.parametrize(
+    'method_name, location',
+    (
+        ( 'provide_cache_location', Path( '/user/cache/test-app' ) ),
+        ( 'provide_data_location', Path( '/user/data/test-app' ) ),
+        ( 'provide_state_location', Path( '/user/state/test-app' ) ),
     )
-    result = globals_obj.provide_cache_location( )
-    assert result == Path( '/user/cache/test-app' )
+)
+def test_300_globals_provide_species_location_basic(
+    baseline_globals, method_name, location
+):
+    ''' Globals provides default directory for each species. '''
+    result = getattr( baseline_globals, method_name )( )
+    assert result == location
 
 
-def test_310_globals_provide_cache_location_with_appendages( ):
+def test_310_globals_provide_cache_location_with_appendages(
+    baseline_globals
+):
     ''' Globals.provide_cache_location handles appendages. '''
-    application = application_module.Information( name = 'test-app' )
-    configuration = { }
-    directories = MagicMock( )
-    directories.user_cache_path = Path( '/user/cache/test-app' )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    result = globals_obj.provide_cache_location( 'temp', 'files' )
+    result = baseline_globals.provide_cache_location( 'temp', 'files' )
     assert result == Path( '/user/cache/test-app/temp/files' )
 
 
-def test_320_globals_provide_data_location_basic( ):
-    ''' Globals.provide_data_location returns data directory. '''
-    application = application_module.Information( name = 'test-app' )
-    configuration = { }
-    directories = MagicMock( )
-    directories.user_data_path = Path( '/user/data/test-app' )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    result = globals_obj.provide_data_location( )
-    assert result == Path( '/user/data/test-app' )
-
-
-def test_330_globals_provide_state_location_basic( ):
-    ''' Globals.provide_state_location returns state directory. '''
-    application = application_module.Information( name = 'test-app' )
-    configuration = { }
-    directories = MagicMock( )
-    directories.user_state_path = Path( '/user/state/test-app' )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    result = globals_obj.provide_state_location( )
-    assert result == Path( '/user/state/test-app' )
-
-
-def test_340_globals_provide_location_with_custom_config( ):
+def test_340_globals_provide_location_with_custom_config(
+    baseline_globals
+):
     ''' Globals.provide_location uses custom configuration specs. '''
-    application = application_module.Information( name = 'test-app' )
     configuration = {
         'locations': {
             'cache': '{user_home}/custom-cache/{application_name}',
             'data': '{user_data}/custom-data'
         }
     }
-    directories = MagicMock( )
-    directories.user_cache_path = Path( '/user/cache/test-app' )
-    directories.user_data_path = Path( '/user/data/test-app' )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
+    globals_obj = dataclasses.replace(
+        baseline_globals, configuration = configuration )
     # Test custom cache location
     cache_result = globals_obj.provide_location(
         module.DirectorySpecies.Cache )
@@ -241,71 +154,44 @@ def test_340_globals_provide_location_with_custom_config( ):
     assert data_result == expected_data
 
 
-def test_350_globals_provide_location_with_appendages_and_config( ):
+def test_350_globals_provide_location_with_appendages_and_config(
+    baseline_globals
+):
     ''' Globals.provide_location combines custom config with appendages. '''
-    application = application_module.Information( name = 'test-app' )
     configuration = {
         'locations': {
             'cache': '{user_home}/custom/{application_name}'
         }
     }
-    directories = MagicMock( )
-    directories.user_cache_path = Path( '/user/cache/test-app' )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
+    globals_obj = dataclasses.replace(
+        baseline_globals, configuration = configuration )
     result = globals_obj.provide_location(
         module.DirectorySpecies.Cache, 'temp', 'files' )
     expected = Path.home( ) / 'custom' / 'test-app' / 'temp' / 'files'
     assert result == expected
 
 
-def test_360_globals_provide_location_fallback_to_default( ):
+def test_360_globals_provide_location_fallback_to_default(
+    baseline_globals
+):
     ''' Globals.provide_location falls back to default when no config. '''
-    application = application_module.Information( name = 'test-app' )
     configuration = { 'other': 'value' }  # No locations config
-    directories = MagicMock( )
-    directories.user_cache_path = Path( '/user/cache/test-app' )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
+    globals_obj = dataclasses.replace(
+        baseline_globals, configuration = configuration )
     result = globals_obj.provide_location( module.DirectorySpecies.Cache )
     assert result == Path( '/user/cache/test-app' )
 
 
-def test_370_globals_provide_location_partial_config( ):
+def test_370_globals_provide_location_partial_config( baseline_globals ):
     ''' Globals.provide_location handles partial location configuration. '''
-    application = application_module.Information( name = 'test-app' )
     configuration = {
         'locations': {
             'cache': '{user_home}/custom-cache'
             # data not configured
         }
     }
-    directories = MagicMock( )
-    directories.user_cache_path = Path( '/user/cache/test-app' )
-    directories.user_data_path = Path( '/user/data/test-app' )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
+    globals_obj = dataclasses.replace(
+        baseline_globals, configuration = configuration )
     # Cache should use custom config
     cache_result = globals_obj.provide_location(
         module.DirectorySpecies.Cache )
@@ -316,94 +202,29 @@ def test_370_globals_provide_location_partial_config( ):
     assert data_result == Path( '/user/data/test-app' )
 
 
-def test_400_globals_immutability( ):
+def test_400_globals_immutability( baseline_globals ):
     ''' Globals instances are immutable. '''
-    application = application_module.Information( name = 'test-app' )
-    configuration = { }
-    directories = MagicMock( )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
     # Should not be able to modify fields after creation
     with pytest.raises( ( AttributeError, TypeError ) ):
-        globals_obj.application = MagicMock( )  # type: ignore
+        baseline_globals.application = MagicMock( )  # type: ignore
 
 
-def test_410_globals_equality( ):
+def test_410_globals_equality( baseline_globals ):
     ''' Globals instances with same data are equal. '''
-    application = application_module.Information( name = 'test-app' )
-    configuration = { 'test': 'value' }
-    directories = MagicMock( )
-    distribution = distribution_module.Information(
-        name = 'test-dist',
-        location = Path( '/test' ),
-        editable = True
-    )
-    exits = MagicMock( )
-    globals1 = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    globals2 = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    assert globals1 == globals2
+    assert dataclasses.replace( baseline_globals ) == baseline_globals
 
 
-def test_420_globals_inequality( ):
+def test_420_globals_inequality( baseline_globals ):
     ''' Globals instances with different data are not equal. '''
-    application1 = application_module.Information( name = 'test-app-1' )
-    application2 = application_module.Information( name = 'test-app-2' )
-    configuration = { }
-    directories = MagicMock( )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals1 = module.Globals(
-        application = application1,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    globals2 = module.Globals(
-        application = application2,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    assert globals1 != globals2
+    globals_obj = dataclasses.replace(
+        baseline_globals,
+        application = application_module.Information( name = 'test-app-2' ) )
+    assert globals_obj != baseline_globals
 
 
-def test_430_globals_string_representation( ):
+def test_430_globals_string_representation( baseline_globals ):
     ''' Globals has useful string representation. '''
-    application = application_module.Information( name = 'test-app' )
-    configuration = { 'test': 'value' }
-    directories = MagicMock( )
-    distribution = MagicMock( )
-    exits = MagicMock( )
-    globals_obj = module.Globals(
-        application = application,
-        configuration = configuration,
-        directories = directories,
-        distribution = distribution,
-        exits = exits
-    )
-    str_repr = str( globals_obj )
-    assert 'test-app' in str_repr
+    assert 'test-app' in str( baseline_globals )
 
 
 def test_440_globals_dataclass_fields( ):
@@ -24,6 +24,7 @@
 import os
 
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import patch
 
 import pytest
@@ -32,12 +33,12 @@ from .__ import PACKAGE_NAME, cache_import_module
 from .fixtures import create_globals_with_temp_dirs
 
 
-def _get_home_environment_vars( ):
-    ''' Get minimal environment variables needed for Path.home(). '''
-    return {
-        key: value for key, value in os.environ.items( )
-        if key in ( 'USERPROFILE', 'HOMEDRIVE', 'HOMEPATH', 'HOME' )
-    }
+# Minimal environment variables needed for Path.home().
+# Captured once; home does not change during test session.
+HOME_ENVIRONMENT = MappingProxyType( {
+    key: os.environ[ key ]
+    for key in ( 'USERPROFILE', 'HOMEDRIVE', 'HOMEPATH', 'HOME' )
+    if key in os.environ } )
 
 
 MODULE_QNAME = f"{PACKAGE_NAME}.environment"
@@ -58,7 +59,7 @@ TEST_VAR_1=editable_value_1
 TEST_VAR_2=editable_value_2
     ''' )
     with patch.dict(
-        os.environ, _get_home_environment_vars( ), clear = True ):
+        os.environ, HOME_ENVIRONMENT, clear = True ):
         await module.update( globals_dto )
 
         # Environment should be updated with values from .env file
@@ -81,7 +82,7 @@ LOCAL_VAR=local_value
 OVERRIDE_VAR=local_override
     ''' )
     with patch.dict(
-        os.environ, _get_home_environment_vars( ), clear = True ):
+        os.environ, HOME_ENVIRONMENT, clear = True ):
         await module.update( globals_dto )
 
         # Environment should be updated with values from both files
@@ -104,7 +105,7 @@ FALLBACK_VAR=fallback_value
         ''' )
 
         with patch.dict(
-            os.environ, _get_home_environment_vars( ), clear = True ):
+            os.environ, HOME_ENVIRONMENT, clear = True ):
             await module.update( globals_dto )
 
             # Should load from local .env since project .env doesn't exist
@@ -128,7 +129,7 @@ CONFIG_VAR=config_value
 PRECEDENCE_VAR=config_precedence
     ''' )
     with patch.dict(
-        os.environ, _get_home_environment_vars( ), clear = True ):
+        os.environ, HOME_ENVIRONMENT, clear = True ):
         await module.update( globals_dto )
 
         # Environment should be updated from configured location
@@ -155,7 +156,7 @@ PRECEDENCE_VAR=local_precedence
         ''' )
 
         with patch.dict(
-            os.environ, _get_home_environment_vars( ), clear = True ):
+            os.environ, HOME_ENVIRONMENT, clear = True ):
             await module.update( globals_dto )
 
             # Both files should be loaded
@@ -179,7 +180,7 @@ LOCAL_ONLY_VAR=local_only_value
         ''' )
 
         with patch.dict(
-            os.environ, _get_home_environment_vars( ), clear = True ):
+            os.environ, HOME_ENVIRONMENT, clear = True ):
             await module.update( globals_dto )
 
             # Should load from local .env only
@@ -206,7 +207,7 @@ API_KEY=secret_key
 API_URL=https://api.example.com
     ''' )
     with patch.dict(
-        os.environ, _get_home_environment_vars( ), clear = True ):
+        os.environ, HOME_ENVIRONMENT, clear = True ):
         await module.update( globals_dto )
         # Environment should have values from both files
         assert os.environ.get( 'DB_HOST' ) == 'localhost'
@@ -221,11 +222,11 @@ async def test_170_update_normal_no_files_exist( ):
     globals_dto, _ = create_globals_with_temp_dirs( editable = False )
     # No .env files exist anywhere
     with patch.dict(
-        os.environ, _get_home_environment_vars( ), clear = True ):
+        os.environ, HOME_ENVIRONMENT, clear = True ):
         # Should complete without error
         await module.update( globals_dto )
         # Environment should only contain home directory variables
-        expected_vars = _get_home_environment_vars( )
+        expected_vars = HOME_ENVIRONMENT
         assert len( os.environ ) == len( expected_vars )
         for key, value in expected_vars.items( ):
             assert os.environ.get( key ) == value
@@ -247,7 +248,7 @@ HOME_VAR=home_value
         ''' )
 
         with patch.dict(
-            os.environ, _get_home_environment_vars( ), clear = True ):
+            os.environ, HOME_ENVIRONMENT, clear = True ):
             await module.update( globals_dto )
 
             # Should load from home-based location
@@ -270,7 +271,7 @@ TEST_INJECT_VAR=inject_value
 ANOTHER_VAR=another_value
     '''
     with patch.dict(
-        os.environ, _get_home_environment_vars( ), clear = True ):
+        os.environ, HOME_ENVIRONMENT, clear = True ):
         result = module._inject_dotenv_data( data )
         # Should return True for successful load
         assert result is True
@@ -282,12 +283,12 @@ ANOTHER_VAR=another_value
 def test_210_inject_dotenv_data_empty( ):
     ''' _inject_dotenv_data handles empty data gracefully. '''
     with patch.dict(
-        os.environ, _get_home_environment_vars( ), clear = True ):
+        os.environ, HOME_ENVIRONMENT, clear = True ):
         result = module._inject_dotenv_data( '' )
         # Should return False for empty data
         assert result is False
         # Environment should only contain home directory variables
-        expected_vars = _get_home_environment_vars( )
+        expected_vars = HOME_ENVIRONMENT
         assert len( os.environ ) == len( expected_vars )
         for key, value in expected_vars.items( ):
             assert os.environ.get( key ) == value
@@ -305,7 +306,7 @@ EMPTY_VAR=
 QUOTED_VAR="quoted value"
     '''
     with patch.dict(
-        os.environ, _get_home_environment_vars( ), clear = True ):
+        os.environ, HOME_ENVIRONMENT, clear = True ):
         result = module._inject_dotenv_data( data )
 
         # Should return True for successful load